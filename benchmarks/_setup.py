@@ -0,0 +1,17 @@
+"""Shared setup for benchmarks which import the package outside of a Django project."""
+
+import os
+
+
+def install_configuration_importer() -> None:
+    """
+    Install the django-configurations importer, which importing the package requires.
+
+    The importer only validates that a settings module and configuration are named, so
+    placeholders are used; they are never imported.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "__benchmark_settings__")
+    os.environ.setdefault("DJANGO_CONFIGURATION", "BenchmarkConfiguration")
+    from configurations import importer
+
+    importer.install()
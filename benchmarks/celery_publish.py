@@ -0,0 +1,73 @@
+"""
+Benchmark publishing Celery tasks from many threads, with each applicable broker profile.
+
+This requires a running broker. Tasks are published to a dedicated queue, which is purged
+afterwards, so no worker is needed.
+
+Usage:
+    python benchmarks/celery_publish.py --broker amqp://localhost:5672/ --tasks 5000 --threads 16
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import time
+from urllib.parse import urlsplit
+
+from _setup import install_configuration_importer
+
+QUEUE_NAME = "composed-configuration-benchmark"
+
+
+def _broker_profiles() -> dict[str, dict]:
+    install_configuration_importer()
+    from composed_configuration import CeleryMixin
+
+    return CeleryMixin.CELERY_BROKER_PROFILES
+
+
+def benchmark(broker_url: str, profile: dict, tasks: int, threads: int) -> float:
+    from celery import Celery
+
+    app = Celery("benchmark", broker=broker_url)
+    app.conf.update(profile, task_default_queue=QUEUE_NAME)
+
+    def publish(_index: int) -> None:
+        app.send_task("benchmark.noop")
+
+    # Establish the first connection outside of the timing
+    app.send_task("benchmark.noop")
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        for _ in executor.map(publish, range(tasks)):
+            pass
+    elapsed = time.perf_counter() - start
+
+    with app.connection_for_write() as connection:
+        connection.default_channel.queue_purge(QUEUE_NAME)
+    app.close()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--broker", default="amqp://localhost:5672/", help="Broker URL.")
+    parser.add_argument("--tasks", type=int, default=5000, help="Tasks to publish.")
+    parser.add_argument("--threads", type=int, default=16, help="Concurrent publishing threads.")
+    args = parser.parse_args()
+
+    if urlsplit(args.broker).scheme in {"redis", "rediss"}:
+        profile_names = ["redis"]
+    else:
+        profile_names = ["cloudamqp", "amqp"]
+
+    broker_profiles = _broker_profiles()
+    for profile_name in profile_names:
+        elapsed = benchmark(args.broker, broker_profiles[profile_name], args.tasks, args.threads)
+        print(
+            f"{profile_name:<12}{args.tasks} tasks from {args.threads} threads "
+            f"in {elapsed:.2f} s ({args.tasks / elapsed:.0f} tasks/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark API pagination classes on a large PostgreSQL table.
+
+This requires a PostgreSQL server, where a table of synthetic rows is created and afterwards
+dropped. Pages are requested at increasing depths with each pagination class, as a list endpoint
+would.
+
+Usage:
+    python benchmarks/pagination.py --database-url postgres://localhost/benchmark --rows 5000000
+"""
+
+import argparse
+import statistics
+import time
+
+from _setup import install_configuration_importer
+
+
+def _configure_django(database_url: str) -> None:
+    import dj_database_url
+    import django
+    from django.conf import settings
+
+    settings.configure(
+        INSTALLED_APPS=["django.contrib.contenttypes", "django.contrib.auth", "rest_framework"],
+        DATABASES={"default": dj_database_url.parse(database_url)},
+        ALLOWED_HOSTS=["*"],
+        REST_FRAMEWORK={"PAGE_SIZE": 100},
+        API_ESTIMATED_COUNT_THRESHOLD=10_000,
+    )
+    django.setup()
+    install_configuration_importer()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", required=True, help="PostgreSQL URL.")
+    parser.add_argument("--rows", type=int, default=5_000_000, help="Rows in the table.")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs to take the median of.")
+    args = parser.parse_args()
+
+    _configure_django(args.database_url)
+    from django.db import connection, models
+    from girder_utils.rest_framework import BoundedLimitOffsetPagination
+    from rest_framework.request import Request
+    from rest_framework.test import APIRequestFactory
+
+    from composed_configuration._rest_framework_support.pagination import (
+        EstimatedCountLimitOffsetPagination,
+        KeysetCursorPagination,
+    )
+
+    class Item(models.Model):
+        name = models.CharField(max_length=100)
+        created = models.DateTimeField(db_index=True)
+
+        class Meta:
+            app_label = "pagination_benchmark"
+            db_table = "pagination_benchmark_item"
+
+    with connection.schema_editor() as schema_editor:
+        schema_editor.create_model(Item)
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {Item._meta.db_table} (name, created) "
+                "SELECT 'item-' || i, now() - i * interval '1 second' "
+                "FROM generate_series(1, %s) AS i",
+                [args.rows],
+            )
+            # Update the planner statistics, as a real table would be
+            cursor.execute(f"ANALYZE {Item._meta.db_table}")
+
+        factory = APIRequestFactory()
+        queryset = Item.objects.order_by("-pk")
+
+        def median_seconds(pagination_class, query: str) -> float:
+            timings = []
+            for _ in range(args.repeat):
+                paginator = pagination_class()
+                start = time.perf_counter()
+                list(paginator.paginate_queryset(queryset, Request(factory.get(f"/?{query}"))))
+                timings.append(time.perf_counter() - start)
+            return statistics.median(timings)
+
+        for offset in [0, args.rows // 100, args.rows // 2, args.rows - 100]:
+            exact_seconds = median_seconds(BoundedLimitOffsetPagination, f"offset={offset}")
+            estimated_seconds = median_seconds(
+                EstimatedCountLimitOffsetPagination, f"offset={offset}"
+            )
+            print(
+                f"offset {offset:>10}: exact count {exact_seconds * 1000:9.1f} ms, "
+                f"estimated count {estimated_seconds * 1000:9.1f} ms"
+            )
+
+        # Cursors can't jump to an offset, but pages seek through the index, so deep pages should
+        # cost the same as the first
+        print(f"cursor page 1: {median_seconds(KeysetCursorPagination, '') * 1000:7.1f} ms")
+        paginator = KeysetCursorPagination()
+        paginator.paginate_queryset(queryset, Request(factory.get("/")))
+        for _ in range(99):
+            next_link = paginator.get_next_link()
+            paginator = KeysetCursorPagination()
+            start = time.perf_counter()
+            list(paginator.paginate_queryset(queryset, Request(factory.get(next_link))))
+            last_seconds = time.perf_counter() - start
+        print(f"cursor page 100: {last_seconds * 1000:7.1f} ms")
+    finally:
+        with connection.schema_editor() as schema_editor:
+            schema_editor.delete_model(Item)
+
+
+if __name__ == "__main__":
+    main()
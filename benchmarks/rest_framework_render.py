@@ -0,0 +1,140 @@
+"""
+Benchmark rendering and parsing paginated DRF responses, with DRF's and this package's JSON classes.
+
+Response bodies are built by a real serializer, so they contain the same types (e.g. ReturnList
+and Decimal strings) as a typical list endpoint.
+
+Usage:
+    python benchmarks/rest_framework_render.py --page-sizes 100 500 1000 --repeat 20
+"""
+
+import argparse
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+import io
+import statistics
+import time
+from typing import Any
+
+from _setup import install_configuration_importer
+import django
+from django.conf import settings
+
+
+def _configure_django() -> None:
+    settings.configure(
+        INSTALLED_APPS=["django.contrib.contenttypes", "django.contrib.auth", "rest_framework"],
+        USE_TZ=True,
+    )
+    django.setup()
+    install_configuration_importer()
+
+
+def _build_page(page_size: int) -> Any:
+    from rest_framework import serializers
+
+    class ItemSerializer(serializers.Serializer):
+        id = serializers.IntegerField()
+        name = serializers.CharField()
+        description = serializers.CharField()
+        created = serializers.DateTimeField()
+        size = serializers.IntegerField()
+        price = serializers.DecimalField(max_digits=10, decimal_places=2)
+        public = serializers.BooleanField()
+        tags = serializers.ListField(child=serializers.CharField())
+        owner = serializers.DictField()
+
+    start_time = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    items = [
+        {
+            "id": index,
+            "name": f"item-{index}",
+            "description": "A moderately long description of this item. " * 3,
+            "created": start_time + timedelta(minutes=index),
+            "size": index * 1024,
+            "price": Decimal(index) / 7,
+            "public": index % 2 == 0,
+            "tags": ["alpha", "beta", "gamma"],
+            "owner": {"id": index % 10, "username": f"user{index % 10}"},
+        }
+        for index in range(page_size)
+    ]
+    return {
+        "count": page_size * 10,
+        "next": "https://example.com/api/v1/items/?limit=100&offset=100",
+        "previous": None,
+        "results": ItemSerializer(items, many=True).data,
+    }
+
+
+def _median_seconds(function: Callable[[], Any], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _compare(
+    operation: str,
+    page_size: int,
+    body_size: int,
+    baseline: Callable[[Any], Any],
+    candidate: Callable[[Any], Any],
+    argument: Any,
+    repeat: int,
+) -> None:
+    baseline_seconds = _median_seconds(lambda: baseline(argument), repeat)
+    candidate_seconds = _median_seconds(lambda: candidate(argument), repeat)
+    print(
+        f"{operation:<8}{page_size:>6} items ({body_size / 1024:7.1f} KiB): "
+        f"DRF {baseline_seconds * 1000:7.2f} ms, "
+        f"orjson {candidate_seconds * 1000:7.2f} ms "
+        f"({baseline_seconds / candidate_seconds:.1f}x)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--page-sizes", type=int, nargs="+", default=[100, 500, 1000], help="Items per page."
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="Runs to take the median of.")
+    args = parser.parse_args()
+
+    _configure_django()
+    from rest_framework.parsers import JSONParser
+    from rest_framework.renderers import JSONRenderer
+
+    from composed_configuration._rest_framework_support.parsers import ORJSONParser
+    from composed_configuration._rest_framework_support.renderers import ORJSONRenderer
+
+    for page_size in args.page_sizes:
+        page = _build_page(page_size)
+        body = JSONRenderer().render(page)
+        assert ORJSONRenderer().render(page) == body, "Renderers produced different output."
+
+        _compare(
+            "render",
+            page_size,
+            len(body),
+            JSONRenderer().render,
+            ORJSONRenderer().render,
+            page,
+            args.repeat,
+        )
+        _compare(
+            "parse",
+            page_size,
+            len(body),
+            lambda data: JSONParser().parse(io.BytesIO(data)),
+            lambda data: ORJSONParser().parse(io.BytesIO(data)),
+            body,
+            args.repeat,
+        )
+
+
+if __name__ == "__main__":
+    main()
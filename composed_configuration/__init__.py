@@ -1,31 +1,39 @@
-from importlib.metadata import PackageNotFoundError, version
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from ._allauth import AllauthMixin
+# This is always imported, as it must modify "Value.late_binding" before any downstream Values are
+# constructed
 from ._base import ComposedConfiguration, ConfigMixin
-from ._celery import CeleryMixin
-from ._configuration import (
-    DevelopmentBaseConfiguration,
-    HerokuProductionBaseConfiguration,
-    ProductionBaseConfiguration,
-    TestingBaseConfiguration,
-)
-from ._cors import CorsMixin
-from ._database import DatabaseMixin
-from ._debug import DebugMixin
-from ._django import DjangoMixin
-from ._email import ConsoleEmailMixin, SmtpEmailMixin
-from ._extensions import ExtensionsMixin
-from ._filter import FilterMixin
-from ._girder_utils import GirderUtilsMixin
-from ._https import HttpsMixin
-from ._logging import LoggingMixin
-from ._rest_framework import RestFrameworkMixin
-from ._sentry import SentryMixin
-from ._static import StaticFileMixin, WhitenoiseStaticFileMixin
-from ._storage import MinioStorageMixin, S3StorageMixin
+
+if TYPE_CHECKING:
+    from ._allauth import AllauthMixin
+    from ._cache import CacheMixin
+    from ._celery import CeleryMixin
+    from ._configuration import (
+        DevelopmentBaseConfiguration,
+        FastTestingBaseConfiguration,
+        HerokuProductionBaseConfiguration,
+        ProductionBaseConfiguration,
+        TestingBaseConfiguration,
+    )
+    from ._cors import CorsMixin
+    from ._database import DatabaseMixin
+    from ._debug import DebugMixin
+    from ._django import DjangoMixin
+    from ._email import ConsoleEmailMixin, SmtpEmailMixin
+    from ._extensions import ExtensionsMixin
+    from ._filter import FilterMixin
+    from ._girder_utils import GirderUtilsMixin
+    from ._https import HttpsMixin
+    from ._logging import LoggingMixin
+    from ._rest_framework import RestFrameworkMixin
+    from ._sentry import SentryMixin
+    from ._static import StaticFileMixin, WhitenoiseStaticFileMixin
+    from ._storage import MinioStorageMixin, S3StorageMixin
 
 __all__ = [
     "AllauthMixin",
+    "CacheMixin",
     "CeleryMixin",
     "ComposedConfiguration",
     "ConfigMixin",
@@ -36,6 +44,7 @@ __all__ = [
     "DevelopmentBaseConfiguration",
     "DjangoMixin",
     "ExtensionsMixin",
+    "FastTestingBaseConfiguration",
     "FilterMixin",
     "GirderUtilsMixin",
     "HerokuProductionBaseConfiguration",
@@ -52,8 +61,55 @@ __all__ = [
     "WhitenoiseStaticFileMixin",
 ]
 
-try:
-    __version__ = version("django-composed-configuration")
-except PackageNotFoundError:
-    # package is not installed
-    pass
+# Mixin modules are only imported when first accessed, so projects which use only some mixins
+# (or short-lived processes which don't load settings at all) don't pay to import all of them
+_lazy_exports = {
+    "AllauthMixin": "._allauth",
+    "CacheMixin": "._cache",
+    "CeleryMixin": "._celery",
+    "ConsoleEmailMixin": "._email",
+    "CorsMixin": "._cors",
+    "DatabaseMixin": "._database",
+    "DebugMixin": "._debug",
+    "DevelopmentBaseConfiguration": "._configuration",
+    "DjangoMixin": "._django",
+    "ExtensionsMixin": "._extensions",
+    "FastTestingBaseConfiguration": "._configuration",
+    "FilterMixin": "._filter",
+    "GirderUtilsMixin": "._girder_utils",
+    "HerokuProductionBaseConfiguration": "._configuration",
+    "HttpsMixin": "._https",
+    "LoggingMixin": "._logging",
+    "MinioStorageMixin": "._storage",
+    "ProductionBaseConfiguration": "._configuration",
+    "RestFrameworkMixin": "._rest_framework",
+    "S3StorageMixin": "._storage",
+    "SentryMixin": "._sentry",
+    "SmtpEmailMixin": "._email",
+    "StaticFileMixin": "._static",
+    "TestingBaseConfiguration": "._configuration",
+    "WhitenoiseStaticFileMixin": "._static",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_exports:
+        value = getattr(import_module(_lazy_exports[name], __name__), name)
+    elif name == "__version__":
+        # importlib.metadata is itself expensive to import
+        from importlib.metadata import PackageNotFoundError, version
+
+        try:
+            value = version("django-composed-configuration")
+        except PackageNotFoundError:
+            # package is not installed
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache the value, so this is only called once per name
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_lazy_exports})
@@ -17,10 +17,11 @@ class AllauthMixin(ConfigMixin):
             "allauth.socialaccount",
         ]
 
-        # Insert before before auth, so the overridden createsuperuser command is found first
-        auth_index = configuration.INSTALLED_APPS.index("django.contrib.auth")
-        configuration.INSTALLED_APPS.insert(
-            auth_index, "composed_configuration._allauth_support.apps.AllauthSupportConfig"
+        # Place before auth, so the overridden createsuperuser command is found first
+        configuration.order_entry(
+            "INSTALLED_APPS",
+            "composed_configuration._allauth_support.apps.AllauthSupportConfig",
+            before="django.contrib.auth",
         )
 
         # auth_style should come before others, to ensure its template overrides are found
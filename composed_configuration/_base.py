@@ -1,8 +1,16 @@
 import contextlib
+from pathlib import Path
+from typing import ClassVar
 import warnings
 
 from configurations import Configuration, values
 from configurations.base import ConfigurationBase
+from configurations.utils import uppercase_attributes
+from configurations.values import setup_value
+
+from ._ordering import DEDUPLICATED_SETTINGS, Relation, order_entries
+from ._profile import profile
+from ._snapshot import EnvironRecorder, load_snapshot, snapshot_path
 
 # With the default "late_binding=False", and "environ_name" is specified or "environ=False",
 # even Values from non-included classes (e.g. `AWS_DEFAULT_REGION) get immediately evaluated and
@@ -35,18 +43,56 @@ class ComposedConfiguration(Configuration, metaclass=FixedConfigurationBase):
     Abstract base for composed Configuration.
 
     This must always be specified as a base class after Config mixins.
+
+    If the `DJANGO_SETTINGS_SNAPSHOT_DIR` environment variable is set, a snapshot of the resolved
+    settings, written by the `compilesettings` management command, will be loaded from that
+    directory instead of resolving the configuration again. Snapshots are keyed by the
+    environment variables which the configuration reads, the source of the modules which define
+    it, and the host's CPU and memory limits, so a stale snapshot is never loaded. Environment
+    variables are recorded when they're read by name (e.g. with `os.environ.get`); settings computed
+    by iterating over the whole environment are only invalidated by `DJANGO_` variables.
     """
 
+    # The path where a snapshot of this configuration may be written, if snapshots are enabled
+    _settings_snapshot_path: Path | None = None
+    # The environment variables which were read while resolving this configuration, if snapshots
+    # are enabled
+    _settings_snapshot_environ: dict[str, str | None] | None = None
+    _environ_recorder: EnvironRecorder | None = None
+
+    # For each list setting, a mapping of entries to the relation and anchor they're placed by
+    _entry_constraints: ClassVar[dict[str, dict[str, tuple[Relation, str]]]] = {}
+
     @classmethod
     def pre_setup(cls):
         super().pre_setup()
 
+        # This must be computed before any Values are bound
+        cls._settings_snapshot_path = snapshot_path(cls)
+        if cls._settings_snapshot_path:
+            with profile("snapshot", cls._settings_snapshot_path.name):
+                snapshot = load_snapshot(cls._settings_snapshot_path)
+            if snapshot is not None:
+                cls._settings_snapshot_environ = snapshot["environ"]
+                # Replace all Values, properties, and mutated settings with their resolved values,
+                # so nothing remains to be bound
+                for name, value in snapshot["settings"].items():
+                    setattr(cls, name, value)
+                return
+            # Properties and mutations may read any environment variable, so record which are read
+            # until every setting is resolved, to know when a snapshot becomes stale
+            cls._environ_recorder = EnvironRecorder()
+            cls._environ_recorder.start()
+
+        cls._entry_constraints = {}
+
         # For every class in the inheritance hierarchy
         # Reverse order allows more base classes to run first
         for base_cls in reversed(cls.__mro__):
             # If the class has "mutate_configuration" as its own (non-inherited) method
             if "mutate_configuration" in base_cls.__dict__:
-                base_cls.mutate_configuration(cls)
+                with profile("mutate", base_cls.__qualname__):
+                    base_cls.mutate_configuration(cls)
             elif "before_binding" in base_cls.__dict__:
                 warnings.warn(
                     'In "ConfigMixin" subclasses, '
@@ -56,6 +102,56 @@ class ComposedConfiguration(Configuration, metaclass=FixedConfigurationBase):
                 )
                 base_cls.before_binding(cls)
 
+        # All mutations are complete, so the final order of list settings can be resolved once
+        for setting in {*DEDUPLICATED_SETTINGS, *cls._entry_constraints}:
+            entries = getattr(cls, setting)
+            # Downstreams may have replaced the setting with an unbound Value
+            if isinstance(entries, list):
+                setattr(
+                    cls,
+                    setting,
+                    order_entries(setting, entries, cls._entry_constraints.get(setting, {})),
+                )
+
+    @classmethod
+    def post_setup(cls):
+        # The django-configurations loader resolves every property before this is called
+        if cls._environ_recorder is not None:
+            cls._environ_recorder.stop()
+            cls._settings_snapshot_environ = cls._environ_recorder.environ
+            cls._environ_recorder = None
+        super().post_setup()
+
+    @classmethod
+    def order_entry(
+        cls, setting: str, entry: str, *, before: str | None = None, after: str | None = None
+    ) -> None:
+        """
+        Add an entry to a list setting, to be placed immediately before or after another entry.
+
+        This may only be called from "mutate_configuration". The entry is added immediately, but
+        is placed only after every mutation is complete, so the order in which mixins are loaded
+        does not matter.
+        """
+        if (before is None) == (after is None):
+            raise TypeError('Exactly one of "before" or "after" must be specified.')
+        relation: Relation = "before" if before is not None else "after"
+        anchor = before if before is not None else after
+        assert anchor is not None
+
+        entries = getattr(cls, setting)
+        if entry not in entries:
+            setattr(cls, setting, [*entries, entry])
+        cls._entry_constraints.setdefault(setting, {})[entry] = (relation, anchor)
+
+    @classmethod
+    def setup(cls):
+        # This is equivalent to "Configuration.setup", but profiles the binding of each Value
+        for name, value in uppercase_attributes(cls).items():
+            if isinstance(value, values.Value):
+                with profile("value", name):
+                    setup_value(cls, name, value)
+
 
 class ConfigMixin:
     """Abstract mixin for composable Config sections."""
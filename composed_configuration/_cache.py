@@ -0,0 +1,139 @@
+from typing import Any
+from urllib.parse import urlsplit
+
+from configurations import values
+
+from ._base import ConfigMixin
+
+SESSION_ENGINES = {
+    "db": "django.contrib.sessions.backends.db",
+    "cache": "django.contrib.sessions.backends.cache",
+    "cached_db": "django.contrib.sessions.backends.cached_db",
+    "signed_cookies": "django.contrib.sessions.backends.signed_cookies",
+}
+
+# Cache compression algorithms, supported by "CompressingRedisSerializer"
+COMPRESSION_ALGORITHMS = ["zlib", "zstd"]
+
+
+def parse_cache_url(url: str) -> dict[str, Any]:
+    """Parse a cache URL into a Django cache configuration."""
+    parsed_url = urlsplit(url)
+    if parsed_url.scheme in {"redis", "rediss"}:
+        # Django's Redis backend accepts Redis URLs directly
+        return {"BACKEND": "django.core.cache.backends.redis.RedisCache", "LOCATION": url}
+    elif parsed_url.scheme == "memcached":
+        if parsed_url.netloc:
+            # e.g. "memcached://host1:11211,host2:11211"
+            location: str | list[str] = parsed_url.netloc.split(",")
+        else:
+            # e.g. "memcached:///run/memcached.sock"
+            location = f"unix:{parsed_url.path}"
+        return {
+            "BACKEND": "django.core.cache.backends.memcached.PyMemcacheCache",
+            "LOCATION": location,
+        }
+    elif parsed_url.scheme == "locmem":
+        return {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": parsed_url.netloc,
+        }
+    raise ValueError(f"Cache URL {repr(url)} does not have a supported scheme.")
+
+
+class CacheMixin(ConfigMixin):
+    """
+    Configure a cache, shared by all processes.
+
+    The `DJANGO_CACHE_URL` environment variable may be externally set to a `redis://`,
+    `rediss://`, `memcached://`, or `locmem://` URL. By default, each process has its own
+    in-memory cache, which is lost on restart.
+
+    The `DJANGO_CACHE_KEY_PREFIX` environment variable may be externally set to prefix all cache
+    keys, typically with a release identifier, so cached values are never read by a release with
+    incompatible code.
+
+    The `DJANGO_CACHE_COMPRESSION` environment variable may be externally set to `zlib` or `zstd`,
+    to compress values larger than `DJANGO_CACHE_COMPRESSION_THRESHOLD` (default 1024) bytes in
+    Redis. `zstd` requires the `zstandard` package on Python versions before 3.14.
+
+    The `DJANGO_CACHE_LOCAL_TIMEOUT` environment variable may be externally set to a number of
+    seconds, to keep a copy of up to `DJANGO_CACHE_LOCAL_MAX_ENTRIES` (default 1000) recently used
+    values in each process, in front of a Redis or Memcached cache. Values may be stale for up to
+    this duration after they're changed by another process, so it should be short. The shared
+    cache remains available as the "shared" cache alias.
+
+    The `DJANGO_SESSION_ENGINE` environment variable may be externally set to `db`, `cache`,
+    `cached_db`, or `signed_cookies`. By default, sessions are read through the cache
+    (`cached_db`) if a shared cache is configured, or from the database otherwise.
+    """
+
+    CACHE_URL = values.Value("locmem://")
+    CACHE_KEY_PREFIX = values.Value("")
+    CACHE_COMPRESSION = values.Value(None)
+    CACHE_COMPRESSION_THRESHOLD = values.PositiveIntegerValue(1024)
+    # 0 disables the local cache
+    CACHE_LOCAL_TIMEOUT = values.IntegerValue(0)
+    CACHE_LOCAL_MAX_ENTRIES = values.PositiveIntegerValue(1000)
+
+    @property
+    def CACHES(self):  # noqa: N802
+        cache = parse_cache_url(self.CACHE_URL)
+        cache["KEY_PREFIX"] = self.CACHE_KEY_PREFIX
+
+        if self.CACHE_COMPRESSION is not None:
+            if self.CACHE_COMPRESSION not in COMPRESSION_ALGORITHMS:
+                raise ValueError(
+                    f"Cache compression {repr(self.CACHE_COMPRESSION)} is not one of: "
+                    f"{', '.join(COMPRESSION_ALGORITHMS)}."
+                )
+            if cache["BACKEND"] == "django.core.cache.backends.redis.RedisCache":
+                cache["OPTIONS"] = {
+                    "serializer": (
+                        "composed_configuration._cache_support.serializers."
+                        "CompressingRedisSerializer"
+                    )
+                }
+
+        if self.CACHE_LOCAL_TIMEOUT <= 0 or cache["BACKEND"].endswith("LocMemCache"):
+            return {"default": cache}
+        return {
+            "default": {
+                "BACKEND": "composed_configuration._cache_support.backends.TieredCache",
+                "OPTIONS": {"LOCAL_ALIAS": "local", "SHARED_ALIAS": "shared"},
+            },
+            "local": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "composed-configuration-local",
+                "TIMEOUT": self.CACHE_LOCAL_TIMEOUT,
+                "KEY_PREFIX": self.CACHE_KEY_PREFIX,
+                "OPTIONS": {"MAX_ENTRIES": self.CACHE_LOCAL_MAX_ENTRIES},
+            },
+            "shared": cache,
+        }
+
+    @property
+    def _has_shared_cache(self) -> bool:
+        return urlsplit(self.CACHE_URL).scheme != "locmem"
+
+    @property
+    def SESSION_ENGINE(self):  # noqa: N802
+        session_engine = values.Value(
+            "cached_db" if self._has_shared_cache else "db",
+            environ_name="SESSION_ENGINE",
+            environ_prefix="DJANGO",
+            late_binding=False,
+        )
+        try:
+            return SESSION_ENGINES[session_engine]
+        except KeyError:
+            raise ValueError(
+                f"Session engine {repr(session_engine)} is not one of: "
+                f"{', '.join(SESSION_ENGINES)}."
+            )
+
+    # Sessions must not be read from a local cache tier, as they would be stale after a login or
+    # logout handled by another process
+    @property
+    def SESSION_CACHE_ALIAS(self):  # noqa: N802
+        return "shared" if "shared" in self.CACHES else "default"
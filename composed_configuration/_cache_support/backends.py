@@ -0,0 +1,109 @@
+from typing import Any
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+_MISSING = object()
+
+
+class TieredCache(BaseCache):
+    """
+    A cache which keeps recently used values from a shared cache in a local, per-process cache.
+
+    The "LOCAL_ALIAS" and "SHARED_ALIAS" options name the two caches. Keys are prefixed and
+    versioned by each of those caches, so this cache's own key settings are unused. Writes go to
+    both caches, but writes by other processes are only seen once the local copy expires, so the
+    local cache should have a short timeout.
+    """
+
+    def __init__(self, location: str, params: dict[str, Any]) -> None:
+        options = dict(params.get("OPTIONS", {}))
+        self.local_alias = options.pop("LOCAL_ALIAS")
+        self.shared_alias = options.pop("SHARED_ALIAS")
+        super().__init__({**params, "OPTIONS": options})
+
+    # Resolve these lazily, as "caches" are created on demand and are thread-local
+    @property
+    def local(self) -> BaseCache:
+        return caches[self.local_alias]
+
+    @property
+    def shared(self) -> BaseCache:
+        return caches[self.shared_alias]
+
+    def _local_timeout(self, timeout: Any) -> Any:
+        # Never keep a local copy for longer than the shared cache does
+        if timeout is DEFAULT_TIMEOUT or timeout is None or timeout > self.local.default_timeout:
+            return DEFAULT_TIMEOUT
+        return timeout
+
+    def get(self, key, default=None, version=None):
+        value = self.local.get(key, _MISSING, version=version)
+        if value is _MISSING:
+            value = self.shared.get(key, _MISSING, version=version)
+            if value is _MISSING:
+                return default
+            self.local.set(key, value, version=version)
+        return value
+
+    def get_many(self, keys, version=None):
+        values = self.local.get_many(keys, version=version)
+        missing_keys = [key for key in keys if key not in values]
+        if missing_keys:
+            shared_values = self.shared.get_many(missing_keys, version=version)
+            self.local.set_many(shared_values, version=version)
+            values.update(shared_values)
+        return values
+
+    def has_key(self, key, version=None):
+        return self.local.has_key(key, version=version) or self.shared.has_key(key, version=version)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.shared.set(key, value, timeout=timeout, version=version)
+        self.local.set(key, value, timeout=self._local_timeout(timeout), version=version)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed_keys = self.shared.set_many(data, timeout=timeout, version=version)
+        self.local.set_many(
+            {key: value for key, value in data.items() if key not in failed_keys},
+            timeout=self._local_timeout(timeout),
+            version=version,
+        )
+        return failed_keys
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        if self.shared.add(key, value, timeout=timeout, version=version):
+            self.local.set(key, value, timeout=self._local_timeout(timeout), version=version)
+            return True
+        # The local copy may be stale
+        self.local.delete(key, version=version)
+        return False
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        self.local.delete(key, version=version)
+        return self.shared.touch(key, timeout=timeout, version=version)
+
+    def incr(self, key, delta=1, version=None):
+        # Counters must be atomic, so they're only stored in the shared cache
+        self.local.delete(key, version=version)
+        return self.shared.incr(key, delta=delta, version=version)
+
+    def decr(self, key, delta=1, version=None):
+        self.local.delete(key, version=version)
+        return self.shared.decr(key, delta=delta, version=version)
+
+    def delete(self, key, version=None):
+        self.local.delete(key, version=version)
+        return self.shared.delete(key, version=version)
+
+    def delete_many(self, keys, version=None):
+        self.local.delete_many(keys, version=version)
+        self.shared.delete_many(keys, version=version)
+
+    def clear(self):
+        self.local.clear()
+        self.shared.clear()
+
+    def close(self, **kwargs):
+        self.local.close(**kwargs)
+        self.shared.close(**kwargs)
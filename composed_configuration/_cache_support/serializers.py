@@ -0,0 +1,46 @@
+import zlib
+
+from django.conf import settings
+from django.core.cache.backends.redis import RedisSerializer
+
+# Compressed values start with one of these, while pickled values start with b"\x80"
+_ZLIB_MARKER = b"\x01"
+_ZSTD_MARKER = b"\x02"
+
+
+def _zstd():
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+    except ImportError:
+        import zstandard as zstd  # type: ignore[import-not-found,no-redef]
+    return zstd
+
+
+class CompressingRedisSerializer(RedisSerializer):
+    """A Redis serializer which compresses large values, with the "CACHE_COMPRESSION" algorithm."""
+
+    def __init__(self, protocol=None) -> None:
+        super().__init__(protocol)
+        self.algorithm = settings.CACHE_COMPRESSION
+        self.threshold = settings.CACHE_COMPRESSION_THRESHOLD
+        if self.algorithm == "zstd":
+            # Fail immediately if it's not available
+            _zstd()
+
+    def dumps(self, obj):
+        data = super().dumps(obj)
+        # Integers are stored unpickled, for atomic increments
+        if isinstance(data, int) or len(data) < self.threshold:
+            return data
+        if self.algorithm == "zstd":
+            return _ZSTD_MARKER + _zstd().compress(data)
+        return _ZLIB_MARKER + zlib.compress(data)
+
+    def loads(self, data):
+        # Values are always decompressed according to their marker, so the algorithm may be
+        # changed without invalidating the cache
+        if data[:1] == _ZLIB_MARKER:
+            data = zlib.decompress(data[1:])
+        elif data[:1] == _ZSTD_MARKER:
+            data = _zstd().decompress(data[1:])
+        return super().loads(data)
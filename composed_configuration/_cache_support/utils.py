@@ -0,0 +1,13 @@
+from django.core.cache import BaseCache, caches
+
+
+def get_shared_cache() -> BaseCache:
+    """
+    Return the cache which is shared by all processes.
+
+    Unlike the default cache, this never returns values which are stale from a local cache tier,
+    so it should be used for values which must be consistent, such as sessions and counters.
+    """
+    if "shared" in caches.settings:
+        return caches["shared"]
+    return caches["default"]
@@ -1,6 +1,25 @@
+from typing import Any
+from urllib.parse import urlsplit
+
 from configurations import values
 
-from ._base import ConfigMixin
+from ._base import ComposedConfiguration, ConfigMixin
+from ._resources import default_worker_concurrency
+
+# The keys which a worker profile may contain; profiles are read by the settings below, not
+# applied wholesale, so any other key would be silently ignored
+_WORKER_PROFILE_KEYS = frozenset(
+    {
+        "task_queues",
+        "task_soft_time_limit",
+        "task_time_limit",
+        "worker_concurrency",
+        "worker_max_memory_per_child",
+        "worker_max_tasks_per_child",
+        "worker_prefetch_multiplier",
+        "min_memory_per_child",
+    }
+)
 
 
 class CeleryMixin(ConfigMixin):
@@ -14,9 +33,37 @@ class CeleryMixin(ConfigMixin):
             namespace='CELERY'
         )
 
-    The `DJANGO_CELERY_BROKER_URL` environment variable may be externally set to an AMQP URL.
+    The `DJANGO_CELERY_BROKER_URL` environment variable may be externally set to an AMQP or Redis
+    URL.
+
+    The `DJANGO_CELERY_BROKER_PROFILE` environment variable may be externally set to the name of
+    one of the `CELERY_BROKER_PROFILES`; otherwise, a profile is inferred from the broker URL: AMQP
+    brokers use `cloudamqp`, which conserves connections. Set it to `amqp` for higher publishing
+    throughput with a self-hosted RabbitMQ.
+
+    The `DJANGO_CELERY_WORKER_CONCURRENCY` environment variable may be externally set to override
+    the number of worker child processes.
+
+    The `DJANGO_CELERY_WORKER_PROFILE` environment variable may be externally set on each worker
+    to the name of one of the `CELERY_WORKER_PROFILES`, to tune it for a particular kind of task.
+
+    The `DJANGO_CELERY_WORKER_MAX_TASKS_PER_CHILD` and `DJANGO_CELERY_WORKER_MAX_MEMORY_PER_CHILD`
+    (in KiB) environment variables may be externally set to override when worker child processes
+    are replaced.
+
+    The `DJANGO_CELERY_TASK_INSTRUMENTATION` environment variable may be externally set to `True`,
+    to log the queue wait time, run time, retries, and worker memory growth of every task. Queue
+    wait time is measured from when each attempt was published, or from its ETA if later (e.g. for
+    a countdown or a retry delay). These are also recorded as Prometheus metrics if the
+    `prometheus_client` package is installed.
     """
 
+    @staticmethod
+    def mutate_configuration(configuration: type[ComposedConfiguration]) -> None:
+        configuration.INSTALLED_APPS += [
+            "composed_configuration._celery_support.apps.CelerySupportConfig"
+        ]
+
     # Assume AMQP.
     CELERY_BROKER_URL = values.Value("amqp://localhost:5672/")
 
@@ -24,6 +71,10 @@ class CeleryMixin(ConfigMixin):
     # The database should be used to communicate results of completed tasks.
     CELERY_RESULT_BACKEND = None
 
+    # Without a results backend, this is the only visibility into task behavior.
+    # This must be set for both publishing and worker processes, to measure queue wait time.
+    CELERY_TASK_INSTRUMENTATION = values.BooleanValue(False)
+
     # Only acknowledge a task being done after the function finishes.
     # This provides safety against worker crashes, but adds the requirement
     # that tasks must be idempotent (which is a best practice anyway).
@@ -58,23 +109,205 @@ class CeleryMixin(ConfigMixin):
     # and this will be Celery's default in 6.0.
     CELERY_WORKER_CANCEL_LONG_RUNNING_TASKS_ON_CONNECTION_LOSS = True
 
-    # CloudAMQP-suggested settings
-    # https://www.cloudamqp.com/docs/celery.html
-    CELERY_BROKER_POOL_LIMIT = 1
-    CELERY_BROKER_HEARTBEAT = None
-    CELERY_BROKER_CONNECTION_TIMEOUT = 30
+    # Broker connection settings, using Celery's lowercase names. Downstreams may override or
+    # extend these profiles.
+    CELERY_BROKER_PROFILES: dict[str, dict[str, Any]] = {
+        # CloudAMQP-suggested settings, which conserve connections on small plans
+        # https://www.cloudamqp.com/docs/celery.html
+        "cloudamqp": {
+            "broker_pool_limit": 1,
+            "broker_heartbeat": None,
+            "broker_connection_timeout": 30,
+        },
+        # A self-hosted RabbitMQ, where connections are plentiful. A single pooled connection would
+        # serialize publishing from every thread in a web process. Publisher confirms add a round
+        # trip to the broker for every published task.
+        "amqp": {
+            "broker_pool_limit": 10,
+            "broker_heartbeat": 60,
+            "broker_connection_timeout": 30,
+            # Wait for the broker to confirm that each message is stored
+            "broker_transport_options": {"confirm_publish": True},
+        },
+        "redis": {
+            "broker_pool_limit": 10,
+            "broker_connection_timeout": 30,
+            "broker_transport_options": {
+                # With late acknowledgement, a task which runs for longer than this is redelivered
+                # to another worker, so this must exceed the longest expected task duration
+                "visibility_timeout": 12 * 60 * 60,
+                # Detect connections silently dropped by load balancers or NAT
+                "socket_keepalive": True,
+                "health_check_interval": 30,
+                "max_connections": 20,
+            },
+        },
+        # An in-process broker, which is only useful for tests
+        "memory": {},
+    }
+    CELERY_BROKER_PROFILE = values.Value(None)
+
+    @property
+    def _celery_broker_profile(self) -> dict[str, Any]:
+        profile_name = self.CELERY_BROKER_PROFILE
+        if profile_name is None:
+            broker_url = urlsplit(self.CELERY_BROKER_URL)
+            if broker_url.scheme in {"redis", "rediss"}:
+                profile_name = "redis"
+            elif broker_url.scheme == "memory":
+                profile_name = "memory"
+            else:
+                # These have always been the settings for AMQP brokers, so other AMQP profiles must
+                # be selected explicitly
+                profile_name = "cloudamqp"
+        try:
+            return self.CELERY_BROKER_PROFILES[profile_name]
+        except KeyError:
+            raise ValueError(
+                f"Celery broker profile {repr(profile_name)} is not one of: "
+                f"{', '.join(self.CELERY_BROKER_PROFILES)}."
+            )
+
+    @property
+    def CELERY_BROKER_POOL_LIMIT(self):  # noqa: N802
+        return self._celery_broker_profile.get("broker_pool_limit", 10)
+
+    @property
+    def CELERY_BROKER_HEARTBEAT(self):  # noqa: N802
+        return self._celery_broker_profile.get("broker_heartbeat")
+
+    @property
+    def CELERY_BROKER_CONNECTION_TIMEOUT(self):  # noqa: N802
+        return self._celery_broker_profile.get("broker_connection_timeout", 30)
+
+    @property
+    def CELERY_BROKER_TRANSPORT_OPTIONS(self):  # noqa: N802
+        return self._celery_broker_profile.get("broker_transport_options", {})
+
     CELERY_EVENT_QUEUE_EXPIRES = 60
 
     # Note, CELERY_WORKER settings could be different on each running worker.
 
-    # Do not prefetch, as the speed benefit for fast-running tasks may not be
+    # Each worker may select a profile, which overrides the settings below for only that worker.
+    # Profiles contain Celery settings (using Celery's lowercase names), plus
+    # "min_memory_per_child", which limits the default concurrency to fit within the memory limit.
+    # Only the keys in _WORKER_PROFILE_KEYS are supported; any other key raises an error.
+    # Each profile consumes only its own queue, so tasks must be routed to it explicitly
+    # (e.g. with "@shared_task(queue='throughput')"); workers without a profile consume the default
+    # queue. Downstreams may override or extend these profiles.
+    CELERY_WORKER_PROFILES: dict[str, dict[str, Any]] = {
+        # For short, interactive tasks, where waiting behind another task is costly
+        "latency": {
+            "task_queues": {"latency": {"exchange": "latency", "routing_key": "latency"}},
+            "worker_prefetch_multiplier": 1,
+            "task_soft_time_limit": 60,
+            "task_time_limit": 90,
+        },
+        # For many tiny tasks, where the round-trip to fetch each message dominates
+        "throughput": {
+            "task_queues": {"throughput": {"exchange": "throughput", "routing_key": "throughput"}},
+            "worker_prefetch_multiplier": 16,
+            "task_soft_time_limit": 60,
+            "task_time_limit": 90,
+        },
+        # For long-running tasks with large working sets, such as data ingest
+        "memory-heavy": {
+            "task_queues": {
+                "memory-heavy": {"exchange": "memory-heavy", "routing_key": "memory-heavy"}
+            },
+            "worker_prefetch_multiplier": 1,
+            "min_memory_per_child": 2 * 1024 * 1024 * 1024,
+        },
+    }
+    CELERY_WORKER_PROFILE = values.Value(None)
+
+    @property
+    def _celery_worker_profile(self) -> dict[str, Any]:
+        if self.CELERY_WORKER_PROFILE is None:
+            return {}
+        try:
+            profile = self.CELERY_WORKER_PROFILES[self.CELERY_WORKER_PROFILE]
+        except KeyError:
+            raise ValueError(
+                f"Celery worker profile {repr(self.CELERY_WORKER_PROFILE)} is not one of: "
+                f"{', '.join(self.CELERY_WORKER_PROFILES)}."
+            )
+        unsupported_keys = profile.keys() - _WORKER_PROFILE_KEYS
+        if unsupported_keys:
+            raise ValueError(
+                f"Celery worker profile {repr(self.CELERY_WORKER_PROFILE)} contains unsupported "
+                f"settings: {', '.join(sorted(unsupported_keys))}. Supported settings are: "
+                f"{', '.join(sorted(_WORKER_PROFILE_KEYS))}."
+            )
+        return profile
+
+    # By default, do not prefetch, as the speed benefit for fast-running tasks may not be
     # worth a potentially unfair allocation with slow-running tasks and
     # multiple workers.
-    CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+    @property
+    def CELERY_WORKER_PREFETCH_MULTIPLIER(self):  # noqa: N802
+        return self._celery_worker_profile.get("worker_prefetch_multiplier", 1)
 
-    # In development, run without concurrency, otherwise accept the default of
-    # the number of CPU cores.
+    # In development, run without concurrency. Otherwise, Celery's default is the number of CPU
+    # cores on the host, which inside a container may greatly exceed its CPU quota and memory
+    # limit, so size to the limits of the current cgroup instead.
     # Workers running memory-intensive tasks may need to decrease this.
     @property
     def CELERY_WORKER_CONCURRENCY(self):  # noqa: N802
-        return 1 if self.DEBUG else None
+        profile = self._celery_worker_profile
+        if self.DEBUG:
+            default_concurrency = 1
+        elif "worker_concurrency" in profile:
+            default_concurrency = profile["worker_concurrency"]
+        elif "min_memory_per_child" in profile:
+            default_concurrency = default_worker_concurrency(profile["min_memory_per_child"])
+        else:
+            default_concurrency = default_worker_concurrency()
+        return values.PositiveIntegerValue(
+            default_concurrency,
+            environ_name="CELERY_WORKER_CONCURRENCY",
+            environ_prefix="DJANGO",
+            # Disable late_binding, to make this return an actual int, not a Value
+            late_binding=False,
+        )
+
+    # Replace a child after it runs this many tasks, to bound slow leaks which aren't visible as
+    # memory growth (e.g. file descriptors or caches). This is Celery's default (no limit), unless
+    # a worker profile sets "worker_max_tasks_per_child".
+    @property
+    def CELERY_WORKER_MAX_TASKS_PER_CHILD(self):  # noqa: N802
+        return values.PositiveIntegerValue(
+            self._celery_worker_profile.get("worker_max_tasks_per_child"),
+            environ_name="CELERY_WORKER_MAX_TASKS_PER_CHILD",
+            environ_prefix="DJANGO",
+            late_binding=False,
+        )
+
+    # Replace a child after a task leaves its resident memory above this limit (in KiB). If this
+    # is not set (and not in development), once a worker has loaded Django and its tasks, the
+    # memory limit of the current cgroup is divided between all children, so slow memory growth
+    # across tasks causes a graceful replacement, instead of the kernel OOM killer choosing a
+    # victim (which, with CELERY_TASK_REJECT_ON_WORKER_LOST, would also lose its task). That is
+    # skipped if it would leave children too little memory above what they use before running
+    # any tasks. Celery only checks this between tasks, so a single task may still exceed it.
+    @property
+    def CELERY_WORKER_MAX_MEMORY_PER_CHILD(self):  # noqa: N802
+        return values.PositiveIntegerValue(
+            self._celery_worker_profile.get("worker_max_memory_per_child"),
+            environ_name="CELERY_WORKER_MAX_MEMORY_PER_CHILD",
+            environ_prefix="DJANGO",
+            late_binding=False,
+        )
+
+    # These are Celery's defaults, unless a worker profile is selected
+    @property
+    def CELERY_TASK_QUEUES(self):  # noqa: N802
+        return self._celery_worker_profile.get("task_queues")
+
+    @property
+    def CELERY_TASK_SOFT_TIME_LIMIT(self):  # noqa: N802
+        return self._celery_worker_profile.get("task_soft_time_limit")
+
+    @property
+    def CELERY_TASK_TIME_LIMIT(self):  # noqa: N802
+        return self._celery_worker_profile.get("task_time_limit")
@@ -0,0 +1,23 @@
+import sys
+
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class CelerySupportConfig(AppConfig):
+    name = "composed_configuration._celery_support"
+    verbose_name = "Composed configuration Celery support"
+
+    def ready(self) -> None:
+        # Only worker processes can recycle children, and they always import Celery before Django
+        # is set up, so avoid importing Celery into other processes
+        if "celery" in sys.modules:
+            from .recycling import connect_recycling
+
+            connect_recycling()
+
+        if settings.CELERY_TASK_INSTRUMENTATION:
+            # Celery's signals are only imported when instrumentation is enabled
+            from .instrumentation import connect_instrumentation
+
+            connect_instrumentation()
@@ -0,0 +1,138 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import logging
+import time
+from typing import Any
+
+from celery.signals import before_task_publish, task_postrun, task_prerun, task_retry
+
+from composed_configuration._resources import current_rss
+
+logger = logging.getLogger(__name__)
+
+# The name of the message header which records when a task was ready to run: when it was
+# published, or its ETA (including countdowns and retry delays) if that is later
+READY_AT_HEADER = "ready_at"
+
+
+@dataclass
+class _TaskStart:
+    perf_counter: float
+    rss: int | None
+
+
+# Tasks which are currently running in this process, by task ID; a prefork child only runs one
+# task at a time, but thread pools may run many
+_running_tasks: dict[str, _TaskStart] = {}
+
+
+class _Metrics:
+    """Prometheus metrics, which are only recorded if "prometheus_client" is installed."""
+
+    def __init__(self) -> None:
+        from prometheus_client import Counter, Histogram
+
+        self.queue_wait = Histogram(
+            "celery_task_queue_wait_seconds",
+            "Time from a task being published (or its ETA, if later) until it starts running.",
+            ["task"],
+            buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 3600),
+        )
+        self.run_time = Histogram(
+            "celery_task_run_seconds",
+            "Time spent running a task.",
+            ["task", "state"],
+            buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60, 300, 900, 3600),
+        )
+        self.rss_delta = Histogram(
+            "celery_task_rss_delta_bytes",
+            "Change in the resident set size of the worker process while running a task.",
+            ["task"],
+            buckets=tuple(2**exponent for exponent in range(20, 34, 2)),
+        )
+        self.retries = Counter("celery_task_retries_total", "Task retries.", ["task"])
+
+
+_metrics: _Metrics | None = None
+
+
+def _on_before_task_publish(headers: dict[str, Any], **kwargs: Any) -> None:
+    # Wall clock time is used, as the publisher and worker are different processes. A retried
+    # task is published again, so this is always reset, to not count previous attempts.
+    ready_at = time.time()
+    # Celery converts countdowns to an ETA, formatted in ISO 8601
+    eta = headers.get("eta")
+    if eta:
+        eta_datetime = datetime.fromisoformat(eta)
+        if eta_datetime.tzinfo is None:
+            # Celery interprets naive ETAs as UTC
+            eta_datetime = eta_datetime.replace(tzinfo=timezone.utc)
+        # A task is not waiting in the queue before its ETA
+        ready_at = max(ready_at, eta_datetime.timestamp())
+    headers[READY_AT_HEADER] = ready_at
+
+
+def _on_task_prerun(task_id: str, task: Any, **kwargs: Any) -> None:
+    _running_tasks[task_id] = _TaskStart(time.perf_counter(), current_rss())
+
+    ready_at = getattr(task.request, READY_AT_HEADER, None)
+    if ready_at is None:
+        # The publisher was not instrumented
+        return
+    queue_wait = max(time.time() - ready_at, 0.0)
+    logger.info(
+        f"Task {task.name}[{task_id}] started after waiting {queue_wait:.3f}s in queue.",
+        extra={"task_name": task.name, "task_id": task_id, "queue_wait_seconds": queue_wait},
+    )
+    if _metrics:
+        _metrics.queue_wait.labels(task.name).observe(queue_wait)
+
+
+def _on_task_postrun(task_id: str, task: Any, state: str | None = None, **kwargs: Any) -> None:
+    task_start = _running_tasks.pop(task_id, None)
+    if task_start is None:
+        return
+    run_time = time.perf_counter() - task_start.perf_counter
+    end_rss = current_rss()
+    rss_delta = (
+        end_rss - task_start.rss if end_rss is not None and task_start.rss is not None else None
+    )
+    logger.info(
+        f"Task {task.name}[{task_id}] finished as {state} in {run_time:.3f}s.",
+        extra={
+            "task_name": task.name,
+            "task_id": task_id,
+            "task_state": state,
+            "run_seconds": run_time,
+            "rss_bytes": end_rss,
+            "rss_delta_bytes": rss_delta,
+        },
+    )
+    if _metrics:
+        _metrics.run_time.labels(task.name, state).observe(run_time)
+        if rss_delta is not None:
+            # Histograms can't record negative values, and freed memory isn't interesting here
+            _metrics.rss_delta.labels(task.name).observe(max(rss_delta, 0))
+
+
+def _on_task_retry(sender: Any, request: Any, reason: Any, **kwargs: Any) -> None:
+    logger.info(
+        f"Task {sender.name}[{request.id}] will be retried: {reason}",
+        extra={"task_name": sender.name, "task_id": request.id, "retry_reason": str(reason)},
+    )
+    if _metrics:
+        _metrics.retries.labels(sender.name).inc()
+
+
+def connect_instrumentation() -> None:
+    """Connect Celery signal receivers, to record the latency and resource usage of tasks."""
+    global _metrics
+    try:
+        _metrics = _Metrics()
+    except ImportError:
+        _metrics = None
+
+    before_task_publish.connect(_on_before_task_publish, dispatch_uid=__name__)
+    task_prerun.connect(_on_task_prerun, dispatch_uid=__name__)
+    task_postrun.connect(_on_task_postrun, dispatch_uid=__name__)
+    task_retry.connect(_on_task_retry, dispatch_uid=__name__)
@@ -0,0 +1,89 @@
+import logging
+import resource
+
+from celery.signals import celeryd_init, task_postrun, worker_process_shutdown
+from django.conf import settings
+
+from composed_configuration._resources import (
+    cgroup_memory_limit,
+    current_rss,
+    default_worker_max_memory_per_child,
+)
+
+logger = logging.getLogger(__name__)
+
+# The number of tasks run by this worker child process
+_task_count = 0
+
+# The memory limit of each worker child process, in KiB, as applied by the parent worker process
+_max_memory_per_child: int | None = None
+
+
+def _on_celeryd_init(conf, options: dict, **kwargs) -> None:
+    """Limit the memory of each worker child process, if no limit is configured."""
+    global _max_memory_per_child
+    _max_memory_per_child = options.get("max_memory_per_child") or conf.worker_max_memory_per_child
+    if _max_memory_per_child is not None or settings.DEBUG:
+        return
+
+    # Django and all tasks have been loaded by now, and the parent worker process's memory is
+    # what each child starts with
+    baseline_rss = current_rss()
+    if baseline_rss is None or cgroup_memory_limit() is None:
+        return
+    concurrency = options.get("concurrency") or conf.worker_concurrency
+    if not concurrency:
+        return
+    _max_memory_per_child = default_worker_max_memory_per_child(concurrency, baseline_rss)
+    if _max_memory_per_child is None:
+        logger.info(
+            "Not limiting the memory of worker child processes, as the memory limit leaves too "
+            f"little headroom above the {baseline_rss // 1024} KiB each uses before any tasks."
+        )
+        return
+    conf.worker_max_memory_per_child = _max_memory_per_child
+    logger.info(f"Limiting the memory of worker child processes to {_max_memory_per_child} KiB.")
+
+
+def _on_task_postrun(**kwargs) -> None:
+    global _task_count
+    _task_count += 1
+
+
+def _exit_reason(max_rss: int) -> str:
+    max_tasks_per_child = settings.CELERY_WORKER_MAX_TASKS_PER_CHILD
+    # Celery compares the peak resident memory to the limit, so this does too
+    if _max_memory_per_child is not None and max_rss > _max_memory_per_child:
+        return f"exceeded the memory limit of {_max_memory_per_child} KiB"
+    if max_tasks_per_child is not None and _task_count >= max_tasks_per_child:
+        return f"reached the limit of {max_tasks_per_child} tasks"
+    return "worker shutdown"
+
+
+def _on_worker_process_shutdown(pid: int, exitcode: int, **kwargs) -> None:
+    # On Linux, this is in KiB
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    rss = current_rss()
+    reason = _exit_reason(max_rss)
+    logger.info(
+        f"Worker child process {pid} exiting after {_task_count} tasks ({reason}).",
+        extra={
+            "worker_pid": pid,
+            "worker_exitcode": exitcode,
+            "worker_task_count": _task_count,
+            "worker_max_rss_kib": max_rss,
+            "worker_rss_bytes": rss,
+            "worker_exit_reason": reason,
+        },
+    )
+
+
+def connect_recycling() -> None:
+    """Connect Celery signal receivers, to limit and log the replacement of worker children."""
+    # This is sent within the parent worker process, after it has loaded Django and all tasks, but
+    # before it reads its settings
+    celeryd_init.connect(_on_celeryd_init, dispatch_uid=__name__)
+    task_postrun.connect(_on_task_postrun, dispatch_uid=__name__)
+    # This is sent within the child process, which prefork pools start with a copy of the parent's
+    # connected receivers
+    worker_process_shutdown.connect(_on_worker_process_shutdown, dispatch_uid=__name__)
@@ -1,10 +1,13 @@
+import copy
+
 from configurations import values
 
 from ._allauth import AllauthMixin
-from ._base import ComposedConfiguration
+from ._base import ComposedConfiguration, ConfigMixin
+from ._cache import CacheMixin
 from ._celery import CeleryMixin
 from ._cors import CorsMixin
-from ._database import DatabaseMixin
+from ._database import DatabaseMixin, _DatabaseURLValue
 from ._debug import DebugMixin
 from ._django import DjangoMixin
 from ._docker import _AlwaysContains, _is_docker
@@ -27,9 +30,9 @@ class _BaseConfiguration(
     CeleryMixin,
     RestFrameworkMixin,
     FilterMixin,
-    # CorsMixin must be loaded after WhitenoiseStaticFileMixin
     CorsMixin,
     WhitenoiseStaticFileMixin,
+    CacheMixin,
     DatabaseMixin,
     LoggingMixin,
     AllauthMixin,
@@ -62,17 +65,66 @@ class DevelopmentBaseConfiguration(
     MINIO_STORAGE_MEDIA_URL = values.Value(None)
 
 
-class TestingBaseConfiguration(MinioStorageMixin, _BaseConfiguration):
+class _TestingMixin(ConfigMixin):
     SECRET_KEY = "testingsecret"
 
     # Testing will add 'testserver' to ALLOWED_HOSTS
     ALLOWED_HOSTS: list[str] = []
 
-    MINIO_STORAGE_MEDIA_BUCKET_NAME = "test-django-storage"
+    # Tests must not share cached values with each other or with other environments
+    CACHE_URL = "locmem://"
+
+    @staticmethod
+    def mutate_configuration(configuration: type[ComposedConfiguration]) -> None:
+        # Tests make many rapid requests from the same client, which must not be throttled
+        configuration.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"].update({"anon": None, "user": None})
 
     # Testing will set EMAIL_BACKEND to use the memory backend
 
 
+class TestingBaseConfiguration(_TestingMixin, MinioStorageMixin, _BaseConfiguration):
+    MINIO_STORAGE_MEDIA_BUCKET_NAME = "test-django-storage"
+
+
+class FastTestingBaseConfiguration(_TestingMixin, _BaseConfiguration):
+    """
+    Configure tests to run quickly, without any services other than PostgreSQL.
+
+    Unlike `TestingBaseConfiguration`, media files are stored in memory instead of MinIO, Celery
+    tasks are run eagerly instead of being sent to a broker, passwords are hashed cheaply, and
+    static files are not compressed. Database commits are asynchronous, which also speeds up
+    creating a test database for each worker of `pytest -n`.
+
+    Tests which depend on the behavior of any of these services should use
+    `TestingBaseConfiguration` instead.
+    """
+
+    @staticmethod
+    def mutate_configuration(configuration: type[ComposedConfiguration]) -> None:
+        configuration.STORAGES.update(
+            {
+                "default": {"BACKEND": "django.core.files.storage.InMemoryStorage"},
+                "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+            }
+        )
+        # Connections use the "test" process role, unless "DJANGO_PROCESS_ROLE" is set. The
+        # inherited Value is shared with every other configuration, so bind a copy of it.
+        databases = copy.copy(configuration.DATABASES)
+        databases.default_process_role = "test"
+        configuration.DATABASES = databases
+
+    # Argon2 is deliberately slow, which dominates the time of tests which create users
+    PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+    CELERY_BROKER_URL = "memory://"
+    CELERY_TASK_ALWAYS_EAGER = True
+    # Otherwise, the exception of an eagerly run task is only returned in its result
+    CELERY_TASK_EAGER_PROPAGATES = True
+
+    # This is also set by Django's test runner, but not when settings are used outside of it
+    EMAIL_BACKEND = "django.core.mail.backends.locmem.EmailBackend"
+
+
 class ProductionBaseConfiguration(
     SentryMixin, SmtpEmailMixin, S3StorageMixin, HttpsMixin, _BaseConfiguration
 ):
@@ -83,7 +135,7 @@ class ProductionBaseConfiguration(
 # yet, given the fragility of ensuring that this is added as a superclass in the correct order.
 class _HerokuMixin:
     # Use different env var names (with no DJANGO_ prefix) for services that Heroku auto-injects
-    DATABASES = values.DatabaseURLValue(
+    DATABASES = _DatabaseURLValue(
         environ_name="DATABASE_URL",
         environ_prefix=None,
         environ_required=True,
@@ -94,6 +146,7 @@ class _HerokuMixin:
     CELERY_BROKER_URL = values.Value(
         environ_name="CLOUDAMQP_URL", environ_prefix=None, environ_required=True
     )
+    CELERY_BROKER_PROFILE = values.Value("cloudamqp")
     # https://help.heroku.com/J2R1S4T8/can-heroku-force-an-application-to-use-ssl-tls
     SECURE_PROXY_SSL_HEADER: tuple[str, str] | None = ("HTTP_X_FORWARDED_PROTO", "https")
     # This may be provided by https://github.com/ianpurvis/heroku-buildpack-version or similar
@@ -12,7 +12,7 @@ class CorsMixin(ConfigMixin):
     * `DJANGO_CORS_ORIGIN_REGEX_WHITELIST`
 
     This requires the `django-cors-headers` package to be installed.
-    This also must be loaded after `WhitenoiseStaticFileMixin`.
+    This also requires `WhitenoiseStaticFileMixin` to be included.
     """
 
     @staticmethod
@@ -21,15 +21,11 @@ class CorsMixin(ConfigMixin):
 
         # CorsMiddleware must be added immediately before WhiteNoiseMiddleware, so this can
         # potentially add CORS headers to those responses too.
-        # Accordingly, CorsMixin must be loaded after WhitenoiseStaticFileMixin, so it can
-        # find the existing entry and insert accordingly.
-        try:
-            whitenoise_index = configuration.MIDDLEWARE.index(
-                "whitenoise.middleware.WhiteNoiseMiddleware"
-            )
-        except ValueError:
-            raise Exception("CorsConfig must be loaded after WhitenoiseStaticFileMixin.")
-        configuration.MIDDLEWARE.insert(whitenoise_index, "corsheaders.middleware.CorsMiddleware")
+        configuration.order_entry(
+            "MIDDLEWARE",
+            "corsheaders.middleware.CorsMiddleware",
+            before="whitenoise.middleware.WhiteNoiseMiddleware",
+        )
 
     CORS_ORIGIN_WHITELIST = values.ListValue()
     CORS_ORIGIN_REGEX_WHITELIST = values.ListValue()
@@ -1,7 +1,185 @@
+from typing import Any
+
 from configurations import values
 
 from ._base import ComposedConfiguration, ConfigMixin
 
+# How each process manages its database connections
+CONNECTION_MODES = ["persistent", "pool", "pgbouncer"]
+
+# PostgreSQL session parameters for each kind of process. Web requests must fail quickly rather
+# than pin connections, background tasks may run long analytical queries, and migrations may
+# run long data migrations, but must not queue behind (and block) other traffic for locks.
+# Test databases are disposable, so commits (including those of migrations when each test
+# database is created) need not wait to be flushed to disk.
+SESSION_PARAMETERS_BY_ROLE: dict[str, dict[str, str]] = {
+    "web": {
+        "statement_timeout": "30s",
+        "lock_timeout": "10s",
+        "idle_in_transaction_session_timeout": "60s",
+    },
+    "worker": {
+        "statement_timeout": "30min",
+        "lock_timeout": "60s",
+        "idle_in_transaction_session_timeout": "10min",
+        "work_mem": "64MB",
+    },
+    "migrate": {
+        "statement_timeout": "0",
+        "lock_timeout": "10s",
+        "idle_in_transaction_session_timeout": "0",
+        "maintenance_work_mem": "256MB",
+    },
+    "test": {
+        "synchronous_commit": "off",
+    },
+}
+
+# Replica database aliases are this, suffixed by a 1-based index
+REPLICA_ALIAS_PREFIX = "replica_"
+
+
+def _configure_connections(database: dict[str, Any], default_process_role: str | None) -> None:
+    connection_mode = values.Value(
+        "persistent",
+        environ_name="DATABASE_CONNECTION_MODE",
+        environ_prefix="DJANGO",
+        late_binding=False,
+    )
+    if connection_mode not in CONNECTION_MODES:
+        raise ValueError(
+            f"Database connection mode {repr(connection_mode)} is not one of: "
+            f"{', '.join(CONNECTION_MODES)}."
+        )
+
+    # Detect reused connections which were closed by the server (e.g. by a restart or an idle
+    # timeout), before a request tries to use them. This costs a round trip each time, and is
+    # pointless for connections which are never reused, so it's opt-in.
+    health_checks = values.BooleanValue(
+        False,
+        environ_name="DATABASE_CONN_HEALTH_CHECKS",
+        environ_prefix="DJANGO",
+        late_binding=False,
+    )
+
+    if connection_mode == "persistent":
+        if health_checks:
+            database["CONN_HEALTH_CHECKS"] = True
+
+    elif connection_mode == "pool":
+        import django
+
+        if django.VERSION < (5, 1):
+            raise Exception("Database connection pooling requires Django 5.1 or later.")
+
+        database.setdefault("OPTIONS", {})["pool"] = {
+            "min_size": values.PositiveIntegerValue(
+                1,
+                environ_name="DATABASE_POOL_MIN_SIZE",
+                environ_prefix="DJANGO",
+                late_binding=False,
+            ),
+            "max_size": values.PositiveIntegerValue(
+                4,
+                environ_name="DATABASE_POOL_MAX_SIZE",
+                environ_prefix="DJANGO",
+                late_binding=False,
+            ),
+            # Seconds to wait for a connection when all are in use, before raising an error
+            "timeout": values.FloatValue(
+                30.0,
+                environ_name="DATABASE_POOL_TIMEOUT",
+                environ_prefix="DJANGO",
+                late_binding=False,
+            ),
+            # Seconds before a connection is replaced, to rebalance across server restarts
+            "max_lifetime": values.FloatValue(
+                3600.0,
+                environ_name="DATABASE_POOL_MAX_LIFETIME",
+                environ_prefix="DJANGO",
+                late_binding=False,
+            ),
+        }
+        if health_checks:
+            # Django's own health checks only apply to connections which it keeps open between
+            # requests, so the pool must check connections as it hands them out instead
+            from psycopg_pool import ConnectionPool
+
+            database["OPTIONS"]["pool"]["check"] = ConnectionPool.check_connection
+        # Django refuses to combine pooling with persistent connections; closing a connection
+        # returns it to the pool instead
+        database["CONN_MAX_AGE"] = 0
+
+    elif connection_mode == "pgbouncer":
+        # In transaction pooling mode, consecutive transactions may run on different server
+        # connections, so state which outlives a transaction is unusable.
+        # Server-side cursors are declared "WITH HOLD" outside of transactions.
+        database["DISABLE_SERVER_SIDE_CURSORS"] = True
+        # Named prepared statements would collide or be missing on other server connections.
+        database.setdefault("OPTIONS", {})["prepare_threshold"] = None
+        # Connecting to PgBouncer is cheap, and idle client connections still count towards its
+        # "max_client_conn" limit
+        database["CONN_MAX_AGE"] = 0
+
+    _configure_session_parameters(database, connection_mode, default_process_role)
+
+
+def _configure_session_parameters(
+    database: dict[str, Any], connection_mode: str, default_process_role: str | None
+) -> None:
+    process_role = values.Value(
+        default_process_role,
+        environ_name="PROCESS_ROLE",
+        environ_prefix="DJANGO",
+        late_binding=False,
+    )
+    if process_role is None:
+        return
+    if process_role not in SESSION_PARAMETERS_BY_ROLE:
+        raise ValueError(
+            f"Process role {repr(process_role)} is not one of: "
+            f"{', '.join(SESSION_PARAMETERS_BY_ROLE)}."
+        )
+    if connection_mode == "pgbouncer":
+        # PgBouncer rejects unknown startup parameters, and server connections are shared between
+        # roles anyway, so these must be set on the server (e.g. with "ALTER ROLE ... SET")
+        return
+
+    # Startup parameters apply to the whole session, without an extra query for each connection
+    session_options = " ".join(
+        f"-c {name}={value}" for name, value in SESSION_PARAMETERS_BY_ROLE[process_role].items()
+    )
+    options = database.setdefault("OPTIONS", {})
+    # Parameters from the URL take precedence, as the last occurrence wins
+    options["options"] = " ".join(filter(None, [session_options, options.get("options")]))
+
+
+class _DatabaseURLValue(values.DatabaseURLValue):
+    """A DatabaseURLValue which also configures connection management from the environment."""
+
+    def __init__(self, *args, default_process_role: str | None = None, **kwargs) -> None:
+        # This is used if the "DJANGO_PROCESS_ROLE" environment variable is not set
+        self.default_process_role = default_process_role
+        super().__init__(*args, **kwargs)
+
+    def setup(self, name: str) -> dict[str, dict[str, Any]]:
+        value = super().setup(name)
+        replica_urls = values.ListValue(
+            [],
+            environ_name="DATABASE_REPLICA_URLS",
+            environ_prefix="DJANGO",
+            late_binding=False,
+        )
+        for index, replica_url in enumerate(replica_urls, start=1):
+            # Use the same dj-database-url options as the primary
+            replica = self.to_python(replica_url)[self.alias]
+            # Replicas contain the same data as the primary, so tests should not create them
+            replica["TEST"] = {"MIRROR": self.alias}
+            value[f"{REPLICA_ALIAS_PREFIX}{index}"] = replica
+        for database in value.values():
+            _configure_connections(database, self.default_process_role)
+        return value
+
 
 class DatabaseMixin(ConfigMixin):
     """
@@ -10,16 +188,65 @@ class DatabaseMixin(ConfigMixin):
     The `DJANGO_DATABASE_URL` environment variable must be externally set
     to a PostgreSQL URL including credentials and the database name.
 
+    The `DJANGO_DATABASE_CONNECTION_MODE` environment variable may be externally set to one of:
+    * `persistent` (the default): Each thread keeps its own connection open for up to 10 minutes.
+      Each process may hold up to one connection per thread, so the total is
+      `<processes> * <threads per process>`.
+    * `pool`: Each process shares a psycopg connection pool between its threads. Each process
+      holds `DJANGO_DATABASE_POOL_MIN_SIZE` (default 1) to `DJANGO_DATABASE_POOL_MAX_SIZE`
+      (default 4) connections, so the total is at most `<processes> * <max size>`. Threads wait up
+      to `DJANGO_DATABASE_POOL_TIMEOUT` (default 30) seconds for a connection, and connections are
+      replaced after `DJANGO_DATABASE_POOL_MAX_LIFETIME` (default 3600) seconds.
+      This requires Django 5.1 and the `psycopg[pool]` package to be installed.
+    * `pgbouncer`: Each thread opens a new connection for each request, to a PgBouncer which
+      uses transaction pooling mode. Server-side cursors and prepared statements are disabled.
+      The total is limited by PgBouncer's pool size instead.
+
+    Each Celery worker child is a separate process, which only runs one task at a time, so a
+    worker needs `DJANGO_CELERY_WORKER_CONCURRENCY` connections in either mode, but a pool
+    maximum size above 1 only wastes connections there. All of these totals must fit within the
+    server's `max_connections`.
+
+    The `DJANGO_DATABASE_CONN_HEALTH_CHECKS` environment variable may be externally set to `True`,
+    to check each reused connection before use, so connections which the server has closed (e.g.
+    by a restart or an idle timeout) are replaced instead of failing a request. This costs an extra
+    round trip for each request or task, and only applies in `persistent` and `pool` modes.
+
+    The `DJANGO_PROCESS_ROLE` environment variable may be externally set to `web`, `worker`,
+    `migrate`, or `test`, to apply the corresponding `SESSION_PARAMETERS_BY_ROLE`
+    (e.g. `statement_timeout`) to every database connection of the process. This has no effect in
+    `pgbouncer` mode.
+
+    The `DJANGO_DATABASE_REPLICA_URLS` environment variable may be externally set to a
+    comma-separated list of PostgreSQL URLs for streaming replicas of the primary database. Reads
+    are then distributed between replicas, except when a replica's replication lag exceeds
+    `DJANGO_DATABASE_REPLICA_MAX_LAG` (default 30) seconds or it is unreachable, and except after
+    a write within the same request or task, so writes are always visible to subsequent reads.
+    Each replica uses as many connections as the primary.
+
+    The `DJANGO_DATABASE_QUERY_SAMPLE_RATE` environment variable may be externally set to the
+    fraction (from 0 to 1) of requests and Celery tasks for which to log the number and duration
+    of queries. Any query shape which is repeated at least `DJANGO_DATABASE_QUERY_REPEAT_THRESHOLD`
+    (default 10) times within one request or task, which typically indicates an N+1 query, is
+    logged as a warning.
+
     This requires the `psycopg` package to be installed.
     """
 
     @staticmethod
     def mutate_configuration(configuration: type[ComposedConfiguration]) -> None:
-        configuration.INSTALLED_APPS += ["django.contrib.postgres"]
+        configuration.INSTALLED_APPS += [
+            "django.contrib.postgres",
+            "composed_configuration._database_support.apps.DatabaseSupportConfig",
+        ]
+        configuration.MIDDLEWARE += [
+            "composed_configuration._database_support.instrumentation."
+            "QueryInstrumentationMiddleware"
+        ]
 
     # This cannot have a default value, since the password and database
     # name are always set by the service admin.
-    DATABASES = values.DatabaseURLValue(
+    DATABASES = _DatabaseURLValue(
         environ_name="DATABASE_URL",
         # django-configurations has environ_prefix=None by default here
         environ_prefix="DJANGO",
@@ -30,6 +257,19 @@ class DatabaseMixin(ConfigMixin):
         conn_max_age=600,
     )
 
+    # In seconds
+    DATABASE_REPLICA_MAX_LAG = values.FloatValue(30.0)
+
+    # Query instrumentation adds a small overhead to every query, so it's disabled by default
+    DATABASE_QUERY_SAMPLE_RATE = values.FloatValue(0.0)
+    DATABASE_QUERY_REPEAT_THRESHOLD = values.PositiveIntegerValue(10)
+
+    @property
+    def DATABASE_ROUTERS(self):  # noqa: N802
+        if any(alias.startswith(REPLICA_ALIAS_PREFIX) for alias in self.DATABASES):
+            return ["composed_configuration._database_support.router.ReplicaRouter"]
+        return []
+
 
 class HerokuDatabaseMixin(DatabaseMixin):
     """
@@ -41,7 +281,7 @@ class HerokuDatabaseMixin(DatabaseMixin):
 
     # Heroku sets the environment variable as DATABASE_URL, so drop the
     # DJANGO_ prefix.
-    DATABASES = values.DatabaseURLValue(
+    DATABASES = _DatabaseURLValue(
         environ_name="DATABASE_URL",
         environ_prefix=None,
         environ_required=True,
@@ -0,0 +1,29 @@
+import sys
+
+from django.apps import AppConfig
+from django.conf import settings
+from django.core import checks
+from django.core.signals import request_started
+
+from .checks import check_pgbouncer_compatibility
+from .router import reset_read_your_writes
+
+
+class DatabaseSupportConfig(AppConfig):
+    name = "composed_configuration._database_support"
+    verbose_name = "Composed configuration database support"
+
+    def ready(self) -> None:
+        checks.register(check_pgbouncer_compatibility, checks.Tags.compatibility)
+
+        # Each request and task starts without having written, so it may read from replicas again
+        request_started.connect(reset_read_your_writes, dispatch_uid=__name__)
+        if "celery" in sys.modules:
+            from celery.signals import task_prerun
+
+            task_prerun.connect(reset_read_your_writes, dispatch_uid=__name__)
+
+            if settings.DATABASE_QUERY_SAMPLE_RATE > 0:
+                from .instrumentation import connect_task_instrumentation
+
+                connect_task_instrumentation()
@@ -0,0 +1,48 @@
+from django.conf import settings
+from django.core.checks import CheckMessage, Warning
+
+
+def check_pgbouncer_compatibility(**kwargs) -> list[CheckMessage]:
+    """Warn about settings which are incompatible with PgBouncer's transaction pooling mode."""
+    messages: list[CheckMessage] = []
+    for alias, database in settings.DATABASES.items():
+        # Disabling server-side cursors is only necessary behind a transaction pooler
+        if not database.get("DISABLE_SERVER_SIDE_CURSORS"):
+            continue
+        options = database.get("OPTIONS", {})
+        if options.get("prepare_threshold", 5) is not None:
+            messages.append(
+                Warning(
+                    f'Database "{alias}" uses prepared statements behind a transaction pooler.',
+                    hint='Set OPTIONS["prepare_threshold"] to None.',
+                    id="composed_configuration.W001",
+                )
+            )
+        if "pool" in options:
+            messages.append(
+                Warning(
+                    f'Database "{alias}" uses a connection pool behind a transaction pooler.',
+                    hint='Remove OPTIONS["pool"], as PgBouncer already pools connections.',
+                    id="composed_configuration.W002",
+                )
+            )
+        if database.get("CONN_MAX_AGE"):
+            messages.append(
+                Warning(
+                    f'Database "{alias}" uses persistent connections behind a transaction pooler.',
+                    hint="Set CONN_MAX_AGE to 0.",
+                    id="composed_configuration.W003",
+                )
+            )
+        if options.get("options"):
+            messages.append(
+                Warning(
+                    f'Database "{alias}" sets session parameters behind a transaction pooler.',
+                    hint=(
+                        "Connection startup parameters may be ignored or rejected by PgBouncer; "
+                        'add them to "ignore_startup_parameters" or configure them on the server.'
+                    ),
+                    id="composed_configuration.W004",
+                )
+            )
+    return messages
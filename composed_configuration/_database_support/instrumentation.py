@@ -0,0 +1,116 @@
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import ExitStack, contextmanager
+import logging
+import random
+import re
+import time
+from typing import Any
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+# Lists of parameters (e.g. from "prefetch_related") vary in length, but have the same shape
+_PARAMETER_LIST_RE = re.compile(r"%s(?:, %s)+")
+
+
+class QueryStats:
+    """Query counts and timing, recorded as a Django database execute wrapper."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.seconds = 0.0
+        # Counted by the exact SQL, as normalizing every query would add overhead
+        self.sql_counts: Counter[str] = Counter()
+
+    def __call__(self, execute, sql, params, many, context) -> Any:
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.count += 1
+            self.sql_counts[sql] += 1
+
+    def repeated_shapes(self, threshold: int) -> list[tuple[str, int]]:
+        """Return query shapes which were run at least `threshold` times, most frequent first."""
+        shape_counts: Counter[str] = Counter()
+        for sql, count in self.sql_counts.items():
+            shape_counts[_PARAMETER_LIST_RE.sub("%s, ...", sql)] += count
+        return [(shape, count) for shape, count in shape_counts.most_common() if count >= threshold]
+
+    def report(self, label: str) -> None:
+        """Log the recorded queries, and any repeated query shapes (e.g. N+1 queries)."""
+        logger.info(
+            f"{label} ran {self.count} queries in {self.seconds * 1000:.1f}ms.",
+            extra={"query_label": label, "query_count": self.count, "query_seconds": self.seconds},
+        )
+        for shape, count in self.repeated_shapes(settings.DATABASE_QUERY_REPEAT_THRESHOLD):
+            logger.warning(
+                f"{label} ran the same query {count} times: {shape}",
+                extra={"query_label": label, "query_count": count, "query_shape": shape},
+            )
+
+
+@contextmanager
+def record_queries() -> Iterator[QueryStats]:
+    """Record all queries made by the current thread, to every database."""
+    stats = QueryStats()
+    with ExitStack() as stack:
+        for alias in connections:
+            stack.enter_context(connections[alias].execute_wrapper(stats))
+        yield stats
+
+
+def _is_sampled() -> bool:
+    return random.random() < settings.DATABASE_QUERY_SAMPLE_RATE
+
+
+class QueryInstrumentationMiddleware:
+    """Record the queries made by a sample of requests, to detect expensive views."""
+
+    def __init__(self, get_response) -> None:
+        if settings.DATABASE_QUERY_SAMPLE_RATE <= 0:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not _is_sampled():
+            return self.get_response(request)
+
+        with record_queries() as stats:
+            response = self.get_response(request)
+        resolver_match = getattr(request, "resolver_match", None)
+        stats.report(resolver_match.view_name if resolver_match else request.path)
+        return response
+
+
+# The recording contexts of tasks which are currently running in this process, by task ID
+_task_recordings: dict[str, tuple[ExitStack, QueryStats]] = {}
+
+
+def _on_task_prerun(task_id: str, **kwargs) -> None:
+    if not _is_sampled():
+        return
+    stack = ExitStack()
+    _task_recordings[task_id] = (stack, stack.enter_context(record_queries()))
+
+
+def _on_task_postrun(task_id: str, task: Any, **kwargs) -> None:
+    recording = _task_recordings.pop(task_id, None)
+    if recording is None:
+        return
+    stack, stats = recording
+    stack.close()
+    stats.report(task.name)
+
+
+def connect_task_instrumentation() -> None:
+    """Connect Celery signal receivers, to record the queries made by a sample of tasks."""
+    from celery.signals import task_postrun, task_prerun
+
+    task_prerun.connect(_on_task_prerun, dispatch_uid=__name__)
+    task_postrun.connect(_on_task_postrun, dispatch_uid=__name__)
@@ -0,0 +1,97 @@
+from contextvars import ContextVar
+import itertools
+import logging
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+from composed_configuration._database import REPLICA_ALIAS_PREFIX
+
+logger = logging.getLogger(__name__)
+
+# Seconds to cache the replication lag of each replica, so it isn't queried for every read
+LAG_CHECK_INTERVAL = 5.0
+
+# The time since the last replayed transaction, or 0 if all received changes have been replayed
+# (as the timestamp doesn't advance when the primary is idle)
+_LAG_QUERY = """
+SELECT
+    CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+"""
+
+# Whether the current request or task has written to the primary database. Context variables are
+# isolated between threads and between asyncio tasks.
+_has_written: ContextVar[bool] = ContextVar("composed_configuration_has_written", default=False)
+
+
+def reset_read_your_writes(**kwargs) -> None:
+    """Allow reads from replicas again, at the start of a request or task."""
+    _has_written.set(False)
+
+
+class ReplicaRouter:
+    """
+    Route reads to replica databases, and all writes to the primary database.
+
+    Reads are routed to the primary database if every replica is lagging or unreachable, and for
+    the remainder of any request or task which has written to the primary database.
+    """
+
+    def __init__(self) -> None:
+        self.replicas = [
+            alias for alias in settings.DATABASES if alias.startswith(REPLICA_ALIAS_PREFIX)
+        ]
+        self.replica_cycle = itertools.cycle(self.replicas)
+        self.max_lag: float = settings.DATABASE_REPLICA_MAX_LAG
+        # The expiration time and availability of each replica
+        self.replica_available: dict[str, tuple[float, bool]] = {}
+
+    def _check_replica(self, alias: str) -> bool:
+        try:
+            with connections[alias].cursor() as cursor:
+                cursor.execute(_LAG_QUERY)
+                (lag,) = cursor.fetchone()
+        except DatabaseError:
+            logger.warning(f'Database replica "{alias}" is unreachable.', exc_info=True)
+            return False
+        if lag > self.max_lag:
+            logger.warning(f'Database replica "{alias}" is lagging by {lag:.1f}s.')
+            return False
+        return True
+
+    def _is_replica_available(self, alias: str) -> bool:
+        now = time.monotonic()
+        expiration, available = self.replica_available.get(alias, (0.0, False))
+        if now >= expiration:
+            available = self._check_replica(alias)
+            self.replica_available[alias] = (now + LAG_CHECK_INTERVAL, available)
+        return available
+
+    def db_for_read(self, model, **hints) -> str:
+        if not _has_written.get():
+            for _ in self.replicas:
+                alias = next(self.replica_cycle)
+                if self._is_replica_available(alias):
+                    return alias
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints) -> str:
+        _has_written.set(True)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool | None:
+        # Replicas contain the same data as the primary database
+        databases = {DEFAULT_DB_ALIAS, *self.replicas}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints) -> bool | None:
+        # Replicas receive schema changes from the primary database
+        if db in self.replicas:
+            return False
+        return None
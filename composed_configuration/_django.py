@@ -18,6 +18,23 @@ class DjangoMixin(ConfigMixin):
     * `SECRET_KEY`, as a random string.
     * `DJANGO_ALLOWED_HOSTS`, as a comma-delimited list of fully-qualified domain names from
        which this server will be accessed.
+
+    The `DJANGO_WARMUP` environment variable may be externally set to `True`, to load the URLconf,
+    templates, API serializers, and API schema on startup, instead of on the first request. This
+    is done by `composed_configuration.wsgi.get_wsgi_application` and
+    `composed_configuration.asgi.get_asgi_application`, which a project's `wsgi.py` or `asgi.py`
+    must use instead of Django's, and by Celery workers. Other processes (e.g. management
+    commands) are unaffected. When a server (e.g. `gunicorn --preload` or a Celery prefork
+    worker) starts Django before forking, this is done once and shared by every child process.
+    The `DJANGO_WARMUP_GC_FREEZE` environment variable may also be set to `True`, so garbage
+    collection in child processes doesn't unshare this memory.
+
+    Passwords are hashed with Argon2. The `DJANGO_ARGON2_TIME_COST`,
+    `DJANGO_ARGON2_MEMORY_COST` (in KiB), and `DJANGO_ARGON2_PARALLELISM` environment variables
+    may be externally set to override Django's default costs. Each concurrent login allocates the
+    memory cost, so a threaded server's peak memory grows with its thread count. The
+    `benchmarkpasswordhasher` management command reports the throughput and peak memory of the
+    current costs on the host where it's run.
     """
 
     @staticmethod
@@ -30,6 +47,7 @@ class DjangoMixin(ConfigMixin):
             "django.contrib.sessions",
             "django.contrib.messages",
             "django.contrib.humanize",
+            "composed_configuration._django_support.apps.DjangoSupportConfig",
         ]
         configuration.MIDDLEWARE += [
             "django.middleware.security.SecurityMiddleware",
@@ -42,8 +60,15 @@ class DjangoMixin(ConfigMixin):
         ]
 
     SECRET_KEY = values.SecretValue()
+    WARMUP = values.BooleanValue(False)
+    WARMUP_GC_FREEZE = values.BooleanValue(False)
     ALLOWED_HOSTS = values.ListValue(environ_required=True)
 
+    # If unset, Django's defaults are used
+    ARGON2_TIME_COST = values.PositiveIntegerValue(None)
+    ARGON2_MEMORY_COST = values.PositiveIntegerValue(None)
+    ARGON2_PARALLELISM = values.PositiveIntegerValue(None)
+
     @property
     def WSGI_APPLICATION(self) -> NoReturn:  # noqa: N802
         raise Exception("WSGI_APPLICATION must be explicitly set.")
@@ -73,7 +98,8 @@ class DjangoMixin(ConfigMixin):
     PASSWORD_HASHERS = [
         # Argon2 is recommended by OWASP, so make it the default for new passwords
         # https://cheatsheetseries.owasp.org/cheatsheets/Password_Storage_Cheat_Sheet.html
-        "django.contrib.auth.hashers.Argon2PasswordHasher",
+        # This is Django's Argon2 hasher, with costs that may be set by the environment
+        "composed_configuration._django_support.hashers.Argon2PasswordHasher",
         # scrypt was the default hasher in older versions of composed-configuration,
         # so it must be enabled to read old passwords
         "django.contrib.auth.hashers.ScryptPasswordHasher",
@@ -0,0 +1,19 @@
+import sys
+
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class DjangoSupportConfig(AppConfig):
+    name = "composed_configuration._django_support"
+    verbose_name = "Composed configuration Django support"
+
+    def ready(self) -> None:
+        if settings.WARMUP and "celery" in sys.modules:
+            from celery.signals import celeryd_init
+
+            from .warmup import _on_celeryd_init
+
+            # This is sent within the parent worker process, after Django is set up and all tasks
+            # are loaded, but before any children are forked
+            celeryd_init.connect(_on_celeryd_init, dispatch_uid=__name__)
@@ -0,0 +1,24 @@
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class Argon2PasswordHasher(hashers.Argon2PasswordHasher):
+    """
+    Argon2 password hashing, with costs set by the "ARGON2_*" settings.
+
+    Any cost which is not set uses Django's default. Since the algorithm name is unchanged, hashes
+    made by Django's own Argon2 hasher are still verified, and any password hashed with different
+    costs is rehashed when its user next logs in.
+    """
+
+    @property
+    def time_cost(self) -> int:  # type: ignore[override]
+        return settings.ARGON2_TIME_COST or super().time_cost
+
+    @property
+    def memory_cost(self) -> int:  # type: ignore[override]
+        return settings.ARGON2_MEMORY_COST or super().memory_cost
+
+    @property
+    def parallelism(self) -> int:  # type: ignore[override]
+        return settings.ARGON2_PARALLELISM or super().parallelism
@@ -0,0 +1,70 @@
+from concurrent.futures import ThreadPoolExecutor
+import resource
+import time
+
+from django.contrib.auth.hashers import Argon2PasswordHasher, get_hasher
+from django.core.management import BaseCommand, CommandParser
+
+from composed_configuration._resources import current_rss
+
+_MIB = 1024 * 1024
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure the throughput and peak memory of the default password hasher "
+        "with its current parameters, as logins would use it on this host."
+    )
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--duration", type=float, default=5.0, help="Seconds to hash for (default 5)."
+        )
+        parser.add_argument(
+            "--threads",
+            type=int,
+            default=1,
+            help="Concurrent hashes, like simultaneous logins in a threaded server (default 1).",
+        )
+
+    def handle(self, *args, **options) -> None:
+        duration: float = options["duration"]
+        threads: int = options["threads"]
+        hasher = get_hasher()
+
+        description = str(hasher.algorithm)
+        if isinstance(hasher, Argon2PasswordHasher):
+            description += (
+                f" (time_cost={hasher.time_cost}, memory_cost={hasher.memory_cost} KiB, "
+                f"parallelism={hasher.parallelism})"
+            )
+        self.stdout.write(f"Hasher: {description}")
+
+        def hash_until(deadline: float) -> int:
+            count = 0
+            # Always hash at least once, so there's something to report
+            while True:
+                hasher.encode("benchmark-password", hasher.salt())
+                count += 1
+                if time.perf_counter() >= deadline:
+                    return count
+
+        start_rss = current_rss()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            counts = list(executor.map(hash_until, [start + duration] * threads))
+        elapsed = time.perf_counter() - start
+        # On Linux, this is in KiB
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+        total = sum(counts)
+        self.stdout.write(
+            f"Hashes: {total} in {elapsed:.2f} s with {threads} threads "
+            f"({total / elapsed:.1f} hashes/s, {elapsed * threads / total * 1000:.0f} ms each)"
+        )
+        peak_description = f"Peak RSS: {peak_rss / _MIB:.1f} MiB"
+        if start_rss is not None:
+            peak_description += (
+                f" (+{(peak_rss - start_rss) / _MIB:.1f} MiB from {start_rss / _MIB:.1f} MiB)"
+            )
+        self.stdout.write(peak_description)
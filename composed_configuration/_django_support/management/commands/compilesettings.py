@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.utils.module_loading import import_string
+
+from composed_configuration._snapshot import SNAPSHOT_DIR_ENVIRON_NAME, write_snapshot
+
+
+class Command(BaseCommand):
+    help = (
+        "Write a snapshot of the resolved settings, "
+        "which later processes in the same environment will load directly."
+    )
+
+    def handle(self, *args, **options) -> None:
+        configuration = import_string(settings.CONFIGURATION)
+        snapshot_path = getattr(configuration, "_settings_snapshot_path", None)
+        if snapshot_path is None:
+            raise CommandError(
+                f"The {SNAPSHOT_DIR_ENVIRON_NAME} environment variable must be set "
+                "to a directory where settings snapshots are stored."
+            )
+
+        count = write_snapshot(
+            snapshot_path, settings.SETTINGS_MODULE, configuration._settings_snapshot_environ
+        )
+        self.stdout.write(f"Wrote {count} settings to {snapshot_path}")
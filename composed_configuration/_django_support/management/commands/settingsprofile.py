@@ -0,0 +1,34 @@
+import json
+
+from django.core.management import BaseCommand, CommandParser
+
+from composed_configuration._profile import profile_entries
+
+
+class Command(BaseCommand):
+    help = "Print the time and imports spent on each step of resolving the settings."
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("--json", action="store_true", help="Output as JSON.")
+        parser.add_argument(
+            "--imports", action="store_true", help="List the modules imported by each step."
+        )
+
+    def handle(self, *args, **options) -> None:
+        entries = sorted(profile_entries(), key=lambda entry: entry.seconds, reverse=True)
+
+        if options["json"]:
+            self.stdout.write(json.dumps([entry.as_dict() for entry in entries], indent=2))
+            return
+
+        for entry in entries:
+            self.stdout.write(
+                f"{entry.seconds * 1000:9.2f} ms  {entry.kind:<8}  {entry.name}"
+                f"  ({len(entry.imports)} imports)"
+            )
+            if options["imports"]:
+                for module_name in entry.imports:
+                    self.stdout.write(f"{'':24}{module_name}")
+        # Nested steps are already included in their enclosing step
+        total = sum(entry.seconds for entry in entries if entry.depth == 0)
+        self.stdout.write(f"{total * 1000:9.2f} ms  total")
@@ -0,0 +1,111 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+import gc
+import logging
+from pathlib import Path
+import time
+from typing import Any
+
+from django.apps import apps
+from django.conf import settings
+from django.template import TemplateDoesNotExist, TemplateSyntaxError, engines
+from django.urls import URLPattern, URLResolver, get_resolver
+
+logger = logging.getLogger(__name__)
+
+
+@contextmanager
+def _step(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        # Anything not warmed up will just be loaded on demand, so never prevent startup
+        logger.warning(f"Warmup of {name} failed.", exc_info=True)
+    else:
+        logger.info(f"Warmed up {name} in {(time.perf_counter() - start) * 1000:.1f}ms.")
+
+
+def _walk_url_patterns(resolver: URLResolver) -> Iterator[URLPattern]:
+    # Accessing these compiles and caches each regex, and the reverse lookup tables
+    resolver.pattern.regex
+    resolver.reverse_dict
+    for url_pattern in resolver.url_patterns:
+        if isinstance(url_pattern, URLResolver):
+            yield from _walk_url_patterns(url_pattern)
+        else:
+            url_pattern.pattern.regex
+            yield url_pattern
+
+
+def _warmup_templates() -> None:
+    for engine in engines.all():
+        template_dirs: list[Path] = [Path(template_dir) for template_dir in engine.template_dirs]
+        for template_dir in template_dirs:
+            for template_path in template_dir.rglob("*"):
+                if not template_path.is_file():
+                    continue
+                try:
+                    # Django's cached template loader (used when DEBUG is False) keeps these
+                    engine.get_template(template_path.relative_to(template_dir).as_posix())
+                except (TemplateDoesNotExist, TemplateSyntaxError, UnicodeDecodeError):
+                    # Template directories may contain other files
+                    continue
+
+
+def _warmup_serializers(view_classes: set[Any]) -> None:
+    serializer_classes = {
+        view_class.serializer_class
+        for view_class in view_classes
+        if getattr(view_class, "serializer_class", None) is not None
+    }
+    for serializer_class in serializer_classes:
+        # Building the fields imports and caches everything needed to introspect the models
+        serializer_class().fields
+
+
+def _warmup_schema() -> None:
+    from drf_yasg import openapi
+    from drf_yasg.generators import OpenAPISchemaGenerator
+
+    generator = OpenAPISchemaGenerator(openapi.Info(title="Warmup", default_version="v1"))
+    generator.get_schema(request=None, public=True)
+
+
+def warmup() -> None:
+    """Load everything which would otherwise be loaded lazily, by the first request in a process."""
+    view_classes: set[Any] = set()
+    with _step("URL patterns"):
+        view_classes = {
+            url_pattern.callback.cls
+            for url_pattern in _walk_url_patterns(get_resolver())
+            # Class-based DRF views
+            if hasattr(url_pattern.callback, "cls")
+        }
+    with _step("templates"):
+        _warmup_templates()
+    if apps.is_installed("rest_framework"):
+        with _step("serializers"):
+            _warmup_serializers(view_classes)
+    if apps.is_installed("drf_yasg"):
+        with _step("API schema"):
+            _warmup_schema()
+
+    if settings.WARMUP_GC_FREEZE:
+        # Move everything into the permanent generation, so garbage collection in forked children
+        # never touches (and copies) the memory pages shared with the parent process
+        gc.collect()
+        gc.freeze()
+        logger.info(f"Froze {gc.get_freeze_count()} objects.")
+
+
+def warmup_if_enabled() -> None:
+    """Run "warmup", if the "WARMUP" setting is enabled; Django must already be set up."""
+    if settings.WARMUP:
+        warmup()
+    else:
+        logger.debug("Skipped warmup, as WARMUP is disabled.")
+
+
+def _on_celeryd_init(**kwargs) -> None:
+    warmup_if_enabled()
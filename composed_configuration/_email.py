@@ -3,6 +3,7 @@ from typing import cast
 from configurations import values
 
 from ._base import ComposedConfiguration, ConfigMixin
+from ._profile import profile
 
 
 class _EmailMixin(ConfigMixin):
@@ -24,17 +25,19 @@ class SmtpEmailMixin(_EmailMixin):
 
     @staticmethod
     def mutate_configuration(configuration: type[ComposedConfiguration]) -> None:
-        email = cast(
-            dict[str, str],
-            values.EmailURLValue(
-                environ_name="EMAIL_URL",
-                environ_prefix="DJANGO",
-                environ_required=True,
-                # Disable late_binding, to make this return a usable value (which is a simple dict)
-                # immediately
-                late_binding=False,
-            ),
-        )
+        # This is bound immediately, so it isn't profiled along with other Values
+        with profile("value", "EMAIL_URL"):
+            email = cast(
+                dict[str, str],
+                values.EmailURLValue(
+                    environ_name="EMAIL_URL",
+                    environ_prefix="DJANGO",
+                    environ_required=True,
+                    # Disable late_binding, to make this return a usable value (which is a simple
+                    # dict) immediately
+                    late_binding=False,
+                ),
+            )
         for email_setting, email_setting_value in email.items():
             setattr(configuration, email_setting, email_setting_value)
 
@@ -1,9 +1,12 @@
 import logging
-
-from django.http import HttpRequest
+from typing import TYPE_CHECKING
 
 from ._base import ConfigMixin
 
+if TYPE_CHECKING:
+    # Importing django.http is expensive, and it's only needed for annotations
+    from django.http import HttpRequest
+
 
 def _filter_favicon_requests(record: logging.LogRecord) -> bool:
     if record.name == "django.request":
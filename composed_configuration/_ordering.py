@@ -0,0 +1,55 @@
+from typing import Literal
+
+from django.core.exceptions import ImproperlyConfigured
+
+Relation = Literal["before", "after"]
+
+# These settings are always deduplicated, as duplicate entries are never useful:
+# Django refuses duplicate app labels, and duplicate middleware runs twice on every request
+DEDUPLICATED_SETTINGS = ["INSTALLED_APPS", "MIDDLEWARE"]
+
+
+def order_entries(
+    setting: str, entries: list[str], constraints: dict[str, tuple[Relation, str]]
+) -> list[str]:
+    """
+    Deduplicate and reorder the entries of a list setting, to satisfy all ordering constraints.
+
+    Each constraint places an entry immediately before or after its anchor entry. Constraints are
+    applied in topological order, so an anchor is always in its final position before any entries
+    are placed relative to it. Apart from that, the existing order of entries is kept.
+    """
+    # Keep the first instance of any duplicates
+    ordered = list(dict.fromkeys(entries))
+    placed: set[str] = set()
+    placing: set[str] = set()
+
+    def place(entry: str) -> None:
+        if entry in placed:
+            return
+        if entry in placing:
+            raise ImproperlyConfigured(
+                f'Ordering constraints for "{entry}" in {setting} are circular.'
+            )
+        placing.add(entry)
+
+        relation, anchor = constraints[entry]
+        if anchor in constraints:
+            place(anchor)
+        if anchor not in ordered:
+            raise ImproperlyConfigured(
+                f'"{entry}" must be placed {relation} "{anchor}", '
+                f"but {setting} does not contain it."
+            )
+
+        if entry in ordered:
+            ordered.remove(entry)
+        anchor_index = ordered.index(anchor)
+        ordered.insert(anchor_index + 1 if relation == "after" else anchor_index, entry)
+
+        placing.remove(entry)
+        placed.add(entry)
+
+    for entry in constraints:
+        place(entry)
+    return ordered
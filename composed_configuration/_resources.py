@@ -0,0 +1,168 @@
+import math
+import os
+from pathlib import Path
+
+# cgroup v1 reports an unlimited memory limit as a very large number (rounded to the page size)
+_UNLIMITED_MEMORY_THRESHOLD = 2**60
+
+# A rough lower bound for the memory needed by each worker child process of a typical Django
+# project, used to avoid starting more children than a memory limit can accommodate
+MIN_MEMORY_PER_CHILD = 256 * 1024 * 1024
+
+# The fraction of the memory limit which worker children may use in total, leaving the remainder
+# for the parent worker process and for growth during the task which exceeds the limit
+WORKER_CHILDREN_MEMORY_FRACTION = 0.8
+
+# A per-child memory limit is only useful if it's at least this multiple of the memory which each
+# child uses before running any tasks; otherwise, children may be replaced after almost every task
+WORKER_CHILD_MEMORY_HEADROOM = 2
+
+# Functions accept an alternative filesystem root, so a fake cgroup filesystem may be inspected
+_ROOT = Path("/")
+
+
+def _cgroup_dirs(controller: str, root: Path) -> list[Path]:
+    """
+    Return directories containing cgroup interface files for the current process.
+
+    Directories are returned most specific first, followed by each of their ancestors, as limits
+    of every ancestor also apply. The `root` argument allows a fake filesystem to be substituted.
+    """
+    cgroup_file = root / "proc/self/cgroup"
+    cgroup_mount = root / "sys/fs/cgroup"
+    try:
+        cgroup_lines = cgroup_file.read_text().splitlines()
+    except OSError:
+        # This does not exist on macOS or Windows
+        return []
+
+    dirs = []
+    for cgroup_line in cgroup_lines:
+        # Each line is "<hierarchy-id>:<controller-list>:<cgroup-path>"
+        fields = cgroup_line.split(":", 2)
+        if len(fields) != 3:
+            # Ignore blank or malformed lines
+            continue
+        _, controllers, cgroup_path = fields
+        if not controllers:
+            # cgroup v2 has a single unified hierarchy, with an empty controller list
+            hierarchy_mount = cgroup_mount
+        elif controller in controllers.split(","):
+            # cgroup v1 mounts each hierarchy separately, named by its controller list
+            hierarchy_mount = cgroup_mount / controllers
+        else:
+            continue
+        cgroup_dir = hierarchy_mount / cgroup_path.lstrip("/")
+        dirs.append(cgroup_dir)
+        while cgroup_dir != hierarchy_mount and hierarchy_mount in cgroup_dir.parents:
+            cgroup_dir = cgroup_dir.parent
+            dirs.append(cgroup_dir)
+    # Without a cgroup namespace, the cgroup path is relative to the host's hierarchy, but only
+    # the container's own cgroup is mounted, so most of these directories may not exist
+    return [cgroup_dir for cgroup_dir in dict.fromkeys(dirs) if cgroup_dir.is_dir()]
+
+
+def _read(path: Path) -> str | None:
+    try:
+        return path.read_text().strip()
+    except OSError:
+        return None
+
+
+def cgroup_cpu_limit(root: Path = _ROOT) -> float | None:
+    """
+    Return the CPU quota of the current cgroup, as a number of CPUs, or None if unlimited.
+
+    This is the smallest quota of the cgroup and any of its ancestors.
+    """
+    cpu_limits = []
+    for cpu_dir in _cgroup_dirs("cpu", root):
+        # cgroup v2
+        cpu_max = _read(cpu_dir / "cpu.max")
+        if cpu_max is not None:
+            quota, period = cpu_max.split()
+            if quota != "max":
+                cpu_limits.append(int(quota) / int(period))
+            continue
+
+        # cgroup v1
+        cfs_quota = _read(cpu_dir / "cpu.cfs_quota_us")
+        cfs_period = _read(cpu_dir / "cpu.cfs_period_us")
+        if cfs_quota is not None and cfs_period is not None and int(cfs_quota) > 0:
+            cpu_limits.append(int(cfs_quota) / int(cfs_period))
+
+    return min(cpu_limits, default=None)
+
+
+def cgroup_memory_limit(root: Path = _ROOT) -> int | None:
+    """
+    Return the memory limit of the current cgroup, in bytes, or None if unlimited.
+
+    This is the smallest limit of the cgroup and any of its ancestors.
+    """
+    memory_limits = []
+    for memory_dir in _cgroup_dirs("memory", root):
+        memory_max = _read(memory_dir / "memory.max")  # cgroup v2
+        if memory_max is None:
+            memory_max = _read(memory_dir / "memory.limit_in_bytes")  # cgroup v1
+        if memory_max is None or memory_max == "max":
+            continue
+        limit = int(memory_max)
+        if limit < _UNLIMITED_MEMORY_THRESHOLD:
+            memory_limits.append(limit)
+
+    return min(memory_limits, default=None)
+
+
+def effective_cpu_count(root: Path = _ROOT) -> int:
+    """Return the number of CPUs usable by this process, considering affinity and cgroups."""
+    if hasattr(os, "sched_getaffinity"):
+        cpu_count = len(os.sched_getaffinity(0))
+    else:
+        cpu_count = os.cpu_count() or 1
+
+    cpu_limit = cgroup_cpu_limit(root)
+    if cpu_limit is not None:
+        # A fractional quota still allows a process to run on one CPU at a time
+        cpu_count = min(cpu_count, math.ceil(cpu_limit))
+    return max(cpu_count, 1)
+
+
+def default_worker_concurrency(
+    min_memory_per_child: int = MIN_MEMORY_PER_CHILD, root: Path = _ROOT
+) -> int:
+    """Return a worker process count that fits within the effective CPU and memory limits."""
+    concurrency = effective_cpu_count(root)
+
+    memory_limit = cgroup_memory_limit(root)
+    if memory_limit is not None:
+        concurrency = min(concurrency, memory_limit // min_memory_per_child)
+    return max(concurrency, 1)
+
+
+def default_worker_max_memory_per_child(
+    concurrency: int, baseline_rss: int, root: Path = _ROOT
+) -> int | None:
+    """
+    Return a per-child memory limit, in KiB, which fits all children within the memory limit.
+
+    The `baseline_rss` argument is the memory used by each child before running any tasks, in
+    bytes. If there is no memory limit, or it leaves too little headroom above this, return None.
+    """
+    memory_limit = cgroup_memory_limit(root)
+    if memory_limit is None:
+        return None
+    max_memory_per_child = int(memory_limit * WORKER_CHILDREN_MEMORY_FRACTION / concurrency)
+    if max_memory_per_child < baseline_rss * WORKER_CHILD_MEMORY_HEADROOM:
+        return None
+    return max(max_memory_per_child // 1024, 1)
+
+
+def current_rss(root: Path = _ROOT) -> int | None:
+    """Return the resident set size of the current process, in bytes, or None if unknown."""
+    statm = _read(root / "proc/self/statm")
+    if statm is None:
+        # This does not exist on macOS or Windows
+        return None
+    # Fields are "<size> <resident> ...", measured in pages
+    return int(statm.split()[1]) * os.sysconf("SC_PAGE_SIZE")
@@ -1,14 +1,50 @@
 from typing import Any
 
+from configurations import values
+
 from ._base import ComposedConfiguration, ConfigMixin
 
+API_PAGINATION_CLASSES = {
+    "limit_offset": "girder_utils.rest_framework.BoundedLimitOffsetPagination",
+    "estimated_count": (
+        "composed_configuration._rest_framework_support.pagination."
+        "EstimatedCountLimitOffsetPagination"
+    ),
+    "cursor": "composed_configuration._rest_framework_support.pagination.KeysetCursorPagination",
+}
+
 
 class RestFrameworkMixin(ConfigMixin):
     """
     Configure Django REST Framework.
 
     This requires the `django-cors-headers`, `django-girder-utils`, `django-oauth-toolkit`,
-    and `drf-yasg` packages to be installed.
+    `drf-yasg`, and `orjson` packages to be installed.
+
+    JSON is rendered and parsed with orjson. The browsable API is only enabled in development.
+
+    The `DJANGO_API_ANON_THROTTLE_RATE` and `DJANGO_API_USER_THROTTLE_RATE` environment variables
+    may be externally set to limit the request rate (e.g. `100/minute`) of each anonymous client IP
+    address and each authenticated user respectively; by default, requests are not throttled.
+    Requests are counted in the shared cache (see `CacheMixin`), so `DJANGO_CACHE_URL` must be set
+    for these to be enforced across processes; a system check warns if it is not.
+
+    The `DJANGO_API_PAGINATION` environment variable may be externally set to one of:
+    * `limit_offset` (the default): Pages are selected by limit and offset, with an exact count.
+    * `estimated_count`: Like `limit_offset`, but if the PostgreSQL planner estimates more than
+      `DJANGO_API_ESTIMATED_COUNT_THRESHOLD` (default 10000) results, the count is estimated.
+    * `cursor`: Pages are selected by an opaque cursor, which seeks through an indexed ordering
+      (the primary key by default). Deep pages are as fast as the first, but there is no count and
+      pages can't be selected by number.
+
+    OAuth2 access tokens are cached in the shared cache for up to
+    `DJANGO_API_ACCESS_TOKEN_CACHE_TIMEOUT` (default 300) seconds, or 0 to disable this.
+
+    Outside of development, public drf-yasg schema views serve a precomputed schema, with an ETag.
+    If the `DJANGO_API_SCHEMA_DIR` environment variable is set, run the `compileschema` management
+    command at build time (e.g. alongside `collectstatic`) to write schemas there. Otherwise, or if
+    a schema was not compiled, it's generated once and kept in the shared cache for
+    `DJANGO_API_SCHEMA_CACHE_TIMEOUT` (default 300) seconds, or 0 to always generate it.
     """
 
     @staticmethod
@@ -18,8 +54,68 @@ class RestFrameworkMixin(ConfigMixin):
             "rest_framework.authtoken",
             "oauth2_provider",
             "drf_yasg",
+            "composed_configuration._rest_framework_support.apps.RestFrameworkSupportConfig",
         ]
 
+        # These are often overridden by downstreams, so only set them if they haven't been
+        configuration.REST_FRAMEWORK.setdefault(
+            "DEFAULT_RENDERER_CLASSES",
+            ["composed_configuration._rest_framework_support.renderers.ORJSONRenderer"]
+            # The browsable API is expensive to render, and only useful for development
+            + (["rest_framework.renderers.BrowsableAPIRenderer"] if configuration.DEBUG else []),
+        )
+        configuration.REST_FRAMEWORK.setdefault(
+            "DEFAULT_PARSER_CLASSES",
+            [
+                "composed_configuration._rest_framework_support.parsers.ORJSONParser",
+                "rest_framework.parsers.FormParser",
+                "rest_framework.parsers.MultiPartParser",
+            ],
+        )
+
+        api_pagination = values.Value(
+            "limit_offset",
+            environ_name="API_PAGINATION",
+            environ_prefix="DJANGO",
+            late_binding=False,
+        )
+        if api_pagination not in API_PAGINATION_CLASSES:
+            raise ValueError(
+                f"API pagination {repr(api_pagination)} is not one of: "
+                f"{', '.join(API_PAGINATION_CLASSES)}."
+            )
+        configuration.REST_FRAMEWORK.setdefault(
+            "DEFAULT_PAGINATION_CLASS", API_PAGINATION_CLASSES[api_pagination]
+        )
+
+        configuration.REST_FRAMEWORK.setdefault(
+            "DEFAULT_THROTTLE_CLASSES",
+            [
+                "composed_configuration._rest_framework_support.throttling.AnonRateThrottle",
+                "composed_configuration._rest_framework_support.throttling.UserRateThrottle",
+            ],
+        )
+        # Throttling is disabled by default, as it's only enforced with a shared cache
+        throttle_rates = configuration.REST_FRAMEWORK.setdefault("DEFAULT_THROTTLE_RATES", {})
+        throttle_rates.setdefault(
+            "anon",
+            values.Value(
+                None,
+                environ_name="API_ANON_THROTTLE_RATE",
+                environ_prefix="DJANGO",
+                late_binding=False,
+            ),
+        )
+        throttle_rates.setdefault(
+            "user",
+            values.Value(
+                None,
+                environ_name="API_USER_THROTTLE_RATE",
+                environ_prefix="DJANGO",
+                late_binding=False,
+            ),
+        )
+
         if configuration.DEBUG:
             configuration.OAUTH2_PROVIDER["ALLOWED_REDIRECT_URI_SCHEMES"] = ["http", "https"]
             # In development, always present the approval dialog
@@ -31,7 +127,17 @@ class RestFrameworkMixin(ConfigMixin):
     SESSION_COOKIE_SAMESITE = "Lax"
     CORS_ALLOW_CREDENTIALS = False
 
-    REST_FRAMEWORK = {
+    API_ESTIMATED_COUNT_THRESHOLD = values.PositiveIntegerValue(10_000)
+
+    # In seconds; 0 disables caching
+    API_ACCESS_TOKEN_CACHE_TIMEOUT = values.IntegerValue(300)
+
+    API_SCHEMA_DIR = values.Value(None)
+
+    # In seconds; 0 disables caching
+    API_SCHEMA_CACHE_TIMEOUT = values.IntegerValue(300)
+
+    REST_FRAMEWORK: dict[str, Any] = {
         "DEFAULT_AUTHENTICATION_CLASSES": [
             "oauth2_provider.contrib.rest_framework.OAuth2Authentication",
             # Allow SessionAuthentication, as this is much more convenient for Ajax requests
@@ -73,8 +179,8 @@ class RestFrameworkMixin(ConfigMixin):
         ],
         # This is a much more sensible degree of basic security
         "DEFAULT_PERMISSION_CLASSES": ["rest_framework.permissions.IsAuthenticatedOrReadOnly"],
-        # BoundedLimitOffsetPagination provides LimitOffsetPagination with a maximum page size
-        "DEFAULT_PAGINATION_CLASS": "girder_utils.rest_framework.BoundedLimitOffsetPagination",
+        # "DEFAULT_PAGINATION_CLASS" is set by "API_PAGINATION_CLASSES". By default,
+        # BoundedLimitOffsetPagination provides LimitOffsetPagination with a maximum page size.
         # This provides a sane default for requests that do not specify a page size.
         # This also ensures that endpoints with pagination will always return a
         # pagination-structured response.
@@ -84,6 +190,11 @@ class RestFrameworkMixin(ConfigMixin):
     }
 
     OAUTH2_PROVIDER = {
+        # Avoid querying the access token and its user on every request
+        "OAUTH2_VALIDATOR_CLASS": (
+            "composed_configuration._rest_framework_support.oauth2_validators."
+            "CachingOAuth2Validator"
+        ),
         "PKCE_REQUIRED": True,
         "ALLOWED_REDIRECT_URI_SCHEMES": ["https"],
         # Don't require users to re-approve scopes each time
@@ -112,6 +223,15 @@ class RestFrameworkMixin(ConfigMixin):
         # security definition for.
         "SECURITY_DEFINITIONS": None,
         "USE_SESSION_AUTH": True,
+        # Serve precomputed schemas, instead of generating them for every request
+        "DEFAULT_GENERATOR_CLASS": (
+            "composed_configuration._rest_framework_support.schema.PrecomputedSchemaGenerator"
+        ),
+        "DEFAULT_SPEC_RENDERERS": [
+            "composed_configuration._rest_framework_support.schema.SwaggerYAMLRenderer",
+            "composed_configuration._rest_framework_support.schema.SwaggerJSONRenderer",
+            "composed_configuration._rest_framework_support.schema.OpenAPIRenderer",
+        ],
     }
 
     REDOC_SETTINGS: dict[str, Any] = {}
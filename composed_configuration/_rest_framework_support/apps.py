@@ -0,0 +1,31 @@
+from django.apps import AppConfig
+from django.contrib.auth import get_user_model
+from django.core import checks
+from django.db.models.signals import post_delete, post_save, pre_delete
+
+from .checks import check_throttle_cache
+
+
+class RestFrameworkSupportConfig(AppConfig):
+    name = "composed_configuration._rest_framework_support"
+    verbose_name = "Composed configuration Django REST Framework support"
+
+    def ready(self) -> None:
+        checks.register(check_throttle_cache, checks.Tags.caches)
+
+        # Cached tokens may be read by any process, so every process must invalidate them
+        from oauth2_provider.models import get_access_token_model
+
+        from .receiver import (
+            invalidate_access_token_on_change,
+            invalidate_access_tokens_on_user_change,
+        )
+
+        access_token_model = get_access_token_model()
+        post_save.connect(invalidate_access_token_on_change, sender=access_token_model)
+        post_delete.connect(invalidate_access_token_on_change, sender=access_token_model)
+
+        user_model = get_user_model()
+        post_save.connect(invalidate_access_tokens_on_user_change, sender=user_model)
+        # The user's tokens are deleted along with it, but they must be found first
+        pre_delete.connect(invalidate_access_tokens_on_user_change, sender=user_model)
@@ -0,0 +1,25 @@
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.checks import CheckMessage, Warning
+from rest_framework.settings import api_settings
+
+from composed_configuration._cache_support.utils import get_shared_cache
+
+
+def check_throttle_cache(**kwargs) -> list[CheckMessage]:
+    """Warn if throttling is enabled, but requests are not counted in a shared cache."""
+    throttle_rates = api_settings.DEFAULT_THROTTLE_RATES
+    if not api_settings.DEFAULT_THROTTLE_CLASSES or not any(throttle_rates.values()):
+        return []
+    if isinstance(get_shared_cache(), (LocMemCache, DummyCache)):
+        return [
+            Warning(
+                "API throttling is enabled, but requests are not counted in a shared cache.",
+                hint=(
+                    "Set DJANGO_CACHE_URL to a Redis or Memcached server; otherwise, each process "
+                    "throttles independently."
+                ),
+                id="composed_configuration.W005",
+            )
+        ]
+    return []
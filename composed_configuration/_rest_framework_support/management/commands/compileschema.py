@@ -0,0 +1,65 @@
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from rest_framework.schemas.generators import EndpointEnumerator, is_api_view
+from rest_framework.test import APIRequestFactory
+
+from composed_configuration._rest_framework_support.schema import (
+    PrecomputedSchemaGenerator,
+    compiling_schemas,
+)
+
+
+class _SchemaViewEnumerator(EndpointEnumerator):
+    """Enumerate public schema views which serve precomputed schemas."""
+
+    def should_include_endpoint(self, path, callback) -> bool:
+        if not is_api_view(callback):
+            return False
+        generator_class = getattr(callback.cls, "generator_class", None)
+        return (
+            isinstance(generator_class, type)
+            and issubclass(generator_class, PrecomputedSchemaGenerator)
+            and callback.cls.public
+            # Paths with parameters (e.g. "swagger{format}") can't be requested directly,
+            # but schema views are typically also routed without any
+            and "{" not in path
+        )
+
+
+class Command(BaseCommand):
+    help = (
+        "Write the schema of each public API schema view, "
+        "which later processes will serve without generating it."
+    )
+
+    def handle(self, *args, **options) -> None:
+        if not settings.API_SCHEMA_DIR:
+            raise CommandError(
+                "The DJANGO_API_SCHEMA_DIR environment variable must be set "
+                "to a directory where API schemas are stored."
+            )
+
+        request_factory = APIRequestFactory()
+        with compiling_schemas() as schema_paths:
+            for path, method, callback in _SchemaViewEnumerator().get_api_endpoints():
+                if method != "GET":
+                    continue
+                # Request the schema as any client would, but without the view's access control
+                # or caching, so its generator receives its own parameters
+                initkwargs = {
+                    **callback.initkwargs,
+                    "authentication_classes": [],
+                    "permission_classes": [],
+                }
+                view = callback.cls.as_view(**initkwargs)
+                response = view(request_factory.get(path, {"format": "openapi"}))
+                if response.status_code != 200:
+                    raise CommandError(
+                        f"Requesting the schema at {path} failed with status "
+                        f"{response.status_code}."
+                    )
+
+        for schema_path in sorted(set(schema_paths)):
+            self.stdout.write(f"Wrote the API schema to {schema_path}")
+        if not schema_paths:
+            self.stdout.write("There are no public API schema views to compile.")
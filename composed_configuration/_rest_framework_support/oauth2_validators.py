@@ -0,0 +1,46 @@
+import hashlib
+
+from django.conf import settings
+from django.utils import timezone
+from oauth2_provider.oauth2_validators import OAuth2Validator
+
+from composed_configuration._cache_support.utils import get_shared_cache
+
+
+def access_token_cache_key(token_checksum: str) -> str:
+    # Never use the raw token, so cache contents can't be used to authenticate
+    return f"composed_configuration:oauth2_access_token:{token_checksum}"
+
+
+def token_checksum(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class CachingOAuth2Validator(OAuth2Validator):
+    """
+    An OAuth2 validator which caches access tokens, and their application and user.
+
+    Tokens are cached in the shared cache for up to the "API_ACCESS_TOKEN_CACHE_TIMEOUT" setting,
+    but never beyond their expiration. Cached tokens are invalidated whenever the token is saved
+    or deleted, or its user is deleted or has its active status, permissions flags, or password
+    saved, so revocation takes effect immediately; however, bulk updates (e.g. "QuerySet.update")
+    don't send signals, so they may not take effect until the timeout.
+    """
+
+    def _load_access_token(self, token):
+        cache_timeout = settings.API_ACCESS_TOKEN_CACHE_TIMEOUT
+        if cache_timeout <= 0:
+            return super()._load_access_token(token)
+
+        cache = get_shared_cache()
+        cache_key = access_token_cache_key(token_checksum(token))
+        access_token = cache.get(cache_key)
+        if access_token is None:
+            access_token = super()._load_access_token(token)
+            # Don't cache misses, as a token may be used as soon as it's created
+            if access_token is not None:
+                remaining_seconds = (access_token.expires - timezone.now()).total_seconds()
+                timeout = min(cache_timeout, int(remaining_seconds))
+                if timeout > 0:
+                    cache.set(cache_key, access_token, timeout=timeout)
+        return access_token
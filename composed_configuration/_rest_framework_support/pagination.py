@@ -0,0 +1,68 @@
+import json
+
+from django.conf import settings
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
+from django.db.models import QuerySet
+from girder_utils.rest_framework import BoundedLimitOffsetPagination
+from rest_framework.pagination import CursorPagination
+
+
+def estimate_count(queryset: QuerySet) -> int | None:
+    """
+    Return the PostgreSQL query planner's estimate of the number of rows in a queryset.
+
+    Planner estimates come from table statistics (e.g. "pg_class.reltuples"), so they're nearly
+    free to compute, but may be inaccurate, especially for complex filters. If the queryset is not
+    in a PostgreSQL database, return None.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    try:
+        sql, params = queryset.query.get_compiler(using=queryset.db).as_sql()
+    except EmptyResultSet:
+        # Django doesn't generate SQL for querysets which can't match anything (e.g. ".none()")
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        (plan,) = cursor.fetchone()
+    # psycopg parses JSON results, but other drivers may not
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+class EstimatedCountLimitOffsetPagination(BoundedLimitOffsetPagination):
+    """
+    Limit-offset pagination which estimates the total count of large querysets.
+
+    An exact count scans every matching row, which dominates the response time for large tables.
+    When the planner estimates more than the "API_ESTIMATED_COUNT_THRESHOLD" setting, the estimate
+    is returned as the count instead; otherwise, the count is exact.
+    """
+
+    def get_count(self, queryset) -> int:
+        if isinstance(queryset, QuerySet):
+            estimated_count = estimate_count(queryset)
+            if (
+                estimated_count is not None
+                and estimated_count > settings.API_ESTIMATED_COUNT_THRESHOLD
+            ):
+                return estimated_count
+        return super().get_count(queryset)
+
+
+class KeysetCursorPagination(CursorPagination):
+    """
+    Cursor pagination, which seeks directly to each page using an indexed ordering.
+
+    Unlike limit-offset pagination, the cost of each page is independent of its depth, and no
+    count is computed, but clients can only move to the next or previous page. The ordering must
+    be unique and indexed; by default, it's the primary key, but views may set an "ordering"
+    attribute (or use an "OrderingFilter") to change this.
+    """
+
+    ordering = "-pk"
+    page_size_query_param = "limit"
+    max_page_size = BoundedLimitOffsetPagination.max_limit
@@ -0,0 +1,56 @@
+from django.contrib.auth.models import AbstractBaseUser
+from django.db import transaction
+from oauth2_provider.models import AbstractAccessToken, get_access_token_model
+
+from composed_configuration._cache_support.utils import get_shared_cache
+
+from .oauth2_validators import access_token_cache_key, token_checksum
+
+# Cached access tokens include their user, so changes to these fields must take effect immediately
+_USER_ACCESS_FIELDS = frozenset({"is_active", "is_staff", "is_superuser", "password"})
+
+
+def _invalidate(access_tokens: list[AbstractAccessToken], using: str) -> None:
+    cache_keys = [
+        access_token_cache_key(
+            # Older versions of django-oauth-toolkit only store the raw token
+            getattr(access_token, "token_checksum", None)
+            or token_checksum(access_token.token)
+        )
+        for access_token in access_tokens
+    ]
+    if not cache_keys:
+        return
+    cache = get_shared_cache()
+    cache.delete_many(cache_keys)
+    # Until the change is committed, other processes still read the old row, and may cache it again
+    transaction.on_commit(lambda: cache.delete_many(cache_keys), using=using)
+
+
+def invalidate_access_token_on_change(
+    sender: type[AbstractAccessToken], instance: AbstractAccessToken, using: str, **kwargs
+) -> None:
+    """Remove a saved or deleted (e.g. revoked) access token from the cache."""
+    _invalidate([instance], using)
+
+
+def invalidate_access_tokens_on_user_change(
+    sender: type[AbstractBaseUser],
+    instance: AbstractBaseUser,
+    using: str,
+    created: bool = False,
+    update_fields: frozenset[str] | None = None,
+    **kwargs,
+) -> None:
+    """
+    Remove all access tokens of a changed (e.g. deactivated) or deleted user from the cache.
+
+    Saves of only other fields (e.g. "last_login", on every login) are ignored.
+    """
+    # A new user has no access tokens
+    if created:
+        return
+    if update_fields is not None and not update_fields & _USER_ACCESS_FIELDS:
+        return
+    access_token_model = get_access_token_model()
+    _invalidate(list(access_token_model.objects.using(using).filter(user_id=instance.pk)), using)
@@ -0,0 +1,45 @@
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+# DRF escapes these, so the output is also valid JavaScript
+_LINE_SEPARATOR = "\u2028".encode()
+_PARAGRAPH_SEPARATOR = "\u2029".encode()
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    A JSON renderer using orjson, which is several times faster than the standard library.
+
+    Output is identical to DRF's JSONRenderer, except that non-finite floats are rendered as null.
+    Indented output (e.g. requested as "application/json; indent=4") and output with the
+    non-default UNICODE_JSON or COMPACT_JSON settings falls back to DRF's JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        renderer_context = renderer_context or {}
+        if (
+            self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # orjson natively handles the most common types; DRF's encoder handles the rest
+        # (e.g. Decimal and lazy translation strings), and datetimes, which it renders differently
+        # (e.g. "Z" instead of "+00:00")
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self.encoder_class().default,
+                option=orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except orjson.JSONEncodeError:
+            # orjson rejects some data which DRF's JSONRenderer accepts (e.g. integers larger than
+            # 64 bits); if the data is really unserializable, this raises DRF's error instead
+            return super().render(data, accepted_media_type, renderer_context)
+        if _LINE_SEPARATOR in ret or _PARAGRAPH_SEPARATOR in ret:
+            ret = ret.replace(_LINE_SEPARATOR, b"\\u2028").replace(_PARAGRAPH_SEPARATOR, b"\\u2029")
+        return ret
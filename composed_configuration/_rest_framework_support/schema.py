@@ -0,0 +1,193 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.utils.http import parse_etags
+from drf_yasg import openapi, renderers
+from drf_yasg.generators import OpenAPISchemaGenerator
+import orjson
+
+from composed_configuration._cache_support.utils import get_shared_cache
+
+logger = logging.getLogger(__name__)
+
+# Schemas read from disk never change during the lifetime of a process, so they're kept in memory
+_loaded_schemas: dict[str, "PrecomputedSwagger"] = {}
+# Schemas which were not compiled are only warned about once
+_missing_schema_keys: set[str] = set()
+
+# While schemas are being compiled, this contains the paths that were written
+_compiled_paths: list[Path] | None = None
+
+
+def schema_cache_key(schema_key: str) -> str:
+    return f"composed_configuration:api_schema:{schema_key}"
+
+
+def spec_digest(spec_json: bytes) -> str:
+    return hashlib.sha256(spec_json).hexdigest()[:32]
+
+
+class PrecomputedSwagger(openapi.Swagger):
+    """A Swagger object which was already generated, from its serialized JSON."""
+
+    def __init__(self, spec_json: bytes, digest: str) -> None:
+        # Swagger.__init__ builds the object from its parts, but "spec_json" is already complete
+        dict.__init__(self, orjson.loads(spec_json))
+        self._digest = digest
+        # Rendered bodies, by renderer class
+        self._rendered: dict[type, bytes] = {}
+
+
+class PrecomputedSchemaGenerator(OpenAPISchemaGenerator):
+    """
+    A schema generator which serves public schemas precomputed by the "compileschema" command.
+
+    Schemas are read from the "API_SCHEMA_DIR" setting if they were compiled there; otherwise, they
+    are generated once and kept in the shared cache for up to the "API_SCHEMA_CACHE_TIMEOUT"
+    setting. In development, or for non-public schema views (which depend on the user's
+    permissions), schemas are always generated for each request.
+    """
+
+    def schema_key(self) -> str:
+        """Return a key identifying the schema produced by this generator's parameters."""
+        patterns = self._gen.patterns
+        urlconf = self._gen.urlconf
+        key_parts = (
+            # Generating a schema sets the shared Info's "version", which "self.version" determines
+            sorted((key, value) for key, value in self.info.items() if key != "version"),
+            self.info._default_version,
+            self.version,
+            self.url,
+            None if patterns is None else [str(pattern.pattern) for pattern in patterns],
+            getattr(urlconf, "__name__", urlconf),
+        )
+        return hashlib.sha256(repr(key_parts).encode()).hexdigest()[:32]
+
+    def _generate_spec_json(self) -> bytes:
+        # Without a request, the API host is omitted unless it's set explicitly, so clients use the
+        # host which served the schema; this makes the schema valid for any request
+        spec = super().get_schema(request=None, public=True).as_dict()
+        return json.dumps(spec, ensure_ascii=False).encode()
+
+    def compile_schema(self, schema_dir: Path) -> Path:
+        """Write this generator's schema to a directory, returning the path written."""
+        # This is only needed when writing, so don't slow down imports for every other process
+        import tempfile
+
+        schema_path = schema_dir / f"{self.schema_key()}.json"
+        schema_dir.mkdir(parents=True, exist_ok=True)
+        # Write atomically, so concurrently starting processes never read a partial schema
+        with tempfile.NamedTemporaryFile(dir=schema_dir, delete=False) as schema_stream:
+            schema_stream.write(self._generate_spec_json())
+        os.chmod(schema_stream.name, 0o644)
+        os.replace(schema_stream.name, schema_path)
+        return schema_path
+
+    def _load_schema(self, schema_key: str) -> PrecomputedSwagger | None:
+        schema = _loaded_schemas.get(schema_key)
+        if schema is None and settings.API_SCHEMA_DIR and schema_key not in _missing_schema_keys:
+            schema_path = Path(settings.API_SCHEMA_DIR) / f"{schema_key}.json"
+            try:
+                spec_json = schema_path.read_bytes()
+            except FileNotFoundError:
+                _missing_schema_keys.add(schema_key)
+                logger.warning(
+                    f"The API schema {schema_path} has not been compiled.",
+                    extra={"schema_path": str(schema_path)},
+                )
+            else:
+                schema = PrecomputedSwagger(spec_json, spec_digest(spec_json))
+                _loaded_schemas[schema_key] = schema
+        return schema
+
+    def get_schema(self, request=None, public=False):
+        if _compiled_paths is not None:
+            schema_path = self.compile_schema(Path(settings.API_SCHEMA_DIR))
+            _compiled_paths.append(schema_path)
+            spec_json = schema_path.read_bytes()
+            return PrecomputedSwagger(spec_json, spec_digest(spec_json))
+
+        # Schemas without any patterns are only used by UI renderers, and are trivial to generate
+        if settings.DEBUG or not public or self._gen.patterns == []:
+            return super().get_schema(request, public)
+
+        schema_key = self.schema_key()
+        schema = self._load_schema(schema_key)
+        if schema is not None:
+            return schema
+
+        cache_timeout = settings.API_SCHEMA_CACHE_TIMEOUT
+        if cache_timeout <= 0:
+            return super().get_schema(request, public)
+
+        cache = get_shared_cache()
+        cache_key = schema_cache_key(schema_key)
+        cached = cache.get(cache_key)
+        if cached is None:
+            spec_json = self._generate_spec_json()
+            cached = (spec_json, spec_digest(spec_json))
+            cache.set(cache_key, cached, timeout=cache_timeout)
+        return PrecomputedSwagger(*cached)
+
+
+@contextmanager
+def compiling_schemas() -> Iterator[list[Path]]:
+    """
+    Compile the schema of each precomputed schema view which is requested within this context.
+
+    Yield the list of paths written, which is filled as requests are made.
+    """
+    global _compiled_paths
+    _compiled_paths = []
+    try:
+        yield _compiled_paths
+    finally:
+        _compiled_paths = None
+
+
+class _PrecomputedSpecRendererMixin:
+    """
+    Render precomputed schemas with an ETag, and only once per process.
+
+    If the request's "If-None-Match" header matches, the body is omitted with a 304 response.
+    """
+
+    format: str
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if not isinstance(data, PrecomputedSwagger):
+            return super().render(data, accepted_media_type, renderer_context)  # type: ignore
+
+        # The same URL may be rendered in several formats, each needing a distinct ETag
+        etag = f'"{data._digest}-{self.format}"'
+        response = renderer_context["response"]
+        response["ETag"] = etag
+        if_none_match = renderer_context["request"].META.get("HTTP_IF_NONE_MATCH", "")
+        if etag in parse_etags(if_none_match) or if_none_match.strip() == "*":
+            response.status_code = 304
+            return b""
+
+        rendered = data._rendered.get(type(self))
+        if rendered is None:
+            rendered = data._rendered[type(self)] = super().render(  # type: ignore
+                data, accepted_media_type, renderer_context
+            )
+        return rendered
+
+
+class SwaggerYAMLRenderer(_PrecomputedSpecRendererMixin, renderers.SwaggerYAMLRenderer):
+    pass
+
+
+class SwaggerJSONRenderer(_PrecomputedSpecRendererMixin, renderers.SwaggerJSONRenderer):
+    pass
+
+
+class OpenAPIRenderer(_PrecomputedSpecRendererMixin, renderers.OpenAPIRenderer):
+    pass
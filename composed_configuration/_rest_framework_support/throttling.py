@@ -0,0 +1,59 @@
+import time
+
+from rest_framework import throttling
+
+from composed_configuration._cache_support.utils import get_shared_cache
+
+
+class CacheCounterRateThrottleMixin:
+    """
+    Throttle with an atomic counter in the shared cache, for each fixed time window.
+
+    DRF's throttles store a list of recent request timestamps for each client, which must be read,
+    filtered, and rewritten on every request, so their cost grows with the allowed rate and
+    concurrent requests may overwrite each other's history. A counter costs the same at any rate.
+
+    As with any fixed window, a client may make up to twice the allowed number of requests around
+    the boundary between two windows.
+    """
+
+    # These are defined by SimpleRateThrottle
+    rate: str | None
+    num_requests: int
+    duration: int
+
+    def allow_request(self, request, view) -> bool:
+        if self.rate is None:
+            return True
+        key = self.get_cache_key(request, view)  # type: ignore[attr-defined]
+        if key is None:
+            return True
+
+        now = time.time()
+        window = int(now // self.duration)
+        counter_key = f"{key}:{window}"
+        cache = get_shared_cache()
+        # This is a no-op if another request already created the counter
+        cache.add(counter_key, 0, timeout=self.duration)
+        try:
+            count = cache.incr(counter_key)
+        except ValueError:
+            # The counter expired between creating and incrementing it
+            cache.set(counter_key, 1, timeout=self.duration)
+            count = 1
+
+        if count > self.num_requests:
+            self.wait_seconds = (window + 1) * self.duration - now
+            return False
+        return True
+
+    def wait(self) -> float:
+        return self.wait_seconds
+
+
+class AnonRateThrottle(CacheCounterRateThrottleMixin, throttling.AnonRateThrottle):
+    pass
+
+
+class UserRateThrottle(CacheCounterRateThrottleMixin, throttling.UserRateThrottle):
+    pass
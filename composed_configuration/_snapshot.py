@@ -0,0 +1,184 @@
+from collections.abc import Callable
+import hashlib
+import os
+from pathlib import Path
+import pickle
+import sys
+from typing import Any
+
+from configurations.utils import isuppercase, uppercase_attributes
+from configurations.values import Value
+
+from ._docker import _is_docker
+from ._resources import cgroup_memory_limit, effective_cpu_count
+
+# If set, this is a directory where resolved settings snapshots are read from and written to.
+# Snapshots are pickles, so this directory must only be writable by trusted users.
+SNAPSHOT_DIR_ENVIRON_NAME = "DJANGO_SETTINGS_SNAPSHOT_DIR"
+
+
+def _package_version() -> str:
+    # importlib.metadata is expensive to import, and is only needed when snapshots are enabled
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version("django-composed-configuration")
+    except PackageNotFoundError:
+        return ""
+
+
+def _relevant_environ_names(configuration: type) -> set[str]:
+    """Return the names of all environment variables which may affect a configuration."""
+    # Values created while mutating or within properties (e.g. "EmailURLValue") aren't visible
+    # on the class, but by convention they use the "DJANGO_" prefix; any others are recorded while
+    # resolving, and checked when loading the snapshot
+    environ_names = {
+        environ_name
+        for environ_name in os.environ
+        if environ_name.startswith("DJANGO_") and environ_name != SNAPSHOT_DIR_ENVIRON_NAME
+    }
+    for name, value in uppercase_attributes(configuration).items():
+        if isinstance(value, Value) and value.environ:
+            environ_names.add(value.full_environ_name(name))
+    return environ_names
+
+
+def _source_files(configuration: type) -> list[Path]:
+    """Return the source files of the modules which define each class of a configuration."""
+    source_files: dict[Path, None] = {}
+    for base_cls in configuration.__mro__:
+        source_file = getattr(sys.modules.get(base_cls.__module__), "__file__", None)
+        if source_file:
+            source_files[Path(source_file)] = None
+    return list(source_files)
+
+
+def _host_facts() -> dict[str, object]:
+    """Return the properties of the host which some settings are derived from."""
+    return {
+        # "CELERY_WORKER_CONCURRENCY"
+        "cpu_count": effective_cpu_count(),
+        "memory_limit": cgroup_memory_limit(),
+        # "INTERNAL_IPS" in development
+        "docker": _is_docker(),
+    }
+
+
+class EnvironRecorder:
+    """
+    Record every environment variable which is read by name (e.g. "os.environ.get"), while active.
+
+    Variables which are read but not set are recorded as None, as setting them later may also
+    change what was computed from them.
+    """
+
+    def __init__(self) -> None:
+        self.environ: dict[str, str | None] = {}
+        self._original_getitem: Callable[[Any, str], str] | None = None
+
+    def start(self) -> None:
+        # "os.environ" is the only instance of its class which has str keys; "get", "in", and
+        # "os.getenv" are all implemented by "__getitem__"
+        environ_cls = type(os.environ)
+        original_getitem = environ_cls.__getitem__
+        recorded_environ = self.environ
+
+        def recording_getitem(environ: Any, key: str) -> str:
+            try:
+                value = original_getitem(environ, key)
+            except KeyError:
+                if environ is os.environ:
+                    recorded_environ.setdefault(key, None)
+                raise
+            if environ is os.environ:
+                recorded_environ.setdefault(key, value)
+            return value
+
+        environ_cls.__getitem__ = recording_getitem  # type: ignore[method-assign]
+        self._original_getitem = original_getitem
+
+    def stop(self) -> None:
+        if self._original_getitem is not None:
+            type(os.environ).__getitem__ = self._original_getitem  # type: ignore[method-assign]
+            self._original_getitem = None
+        self.environ.pop(SNAPSHOT_DIR_ENVIRON_NAME, None)
+
+
+def snapshot_path(configuration: type) -> Path | None:
+    """
+    Return the path of the settings snapshot for a configuration in the current environment.
+
+    This must be called before the configuration is resolved, while its Values are still unbound.
+    If snapshots are not enabled, return None.
+    """
+    snapshot_dir = os.environ.get(SNAPSHOT_DIR_ENVIRON_NAME)
+    if not snapshot_dir:
+        return None
+
+    digest = hashlib.sha256()
+    digest.update(_package_version().encode())
+    # Changes to the settings module itself (e.g. a new release), or to any module which defines a
+    # base class of the configuration, must also invalidate snapshots
+    for source_file in _source_files(configuration):
+        digest.update(source_file.read_bytes())
+    # A snapshot compiled on one host must not be loaded on a host with different resources
+    for name, fact in _host_facts().items():
+        digest.update(f"{name}={fact}\0".encode())
+    for environ_name in sorted(_relevant_environ_names(configuration)):
+        environ_value = os.environ.get(environ_name)
+        if environ_value is not None:
+            digest.update(f"{environ_name}={environ_value}\0".encode())
+
+    return Path(snapshot_dir) / f"{configuration.__qualname__}-{digest.hexdigest()[:32]}.pickle"
+
+
+def load_snapshot(path: Path) -> dict[str, Any] | None:
+    """
+    Load the settings of a snapshot, or return None if it does not exist or is stale.
+
+    A snapshot is stale if any environment variable which was read while resolving its settings
+    has since changed.
+    """
+    try:
+        with path.open("rb") as snapshot_stream:
+            snapshot = pickle.load(snapshot_stream)
+    except FileNotFoundError:
+        return None
+    # Snapshots written by earlier versions didn't record the environment
+    if "environ" not in snapshot:
+        return None
+    # Settings may be computed from any environment variable (e.g. by properties), not only the
+    # ones which the snapshot path is keyed by
+    for environ_name, environ_value in snapshot["environ"].items():
+        if os.environ.get(environ_name) != environ_value:
+            return None
+    return snapshot
+
+
+def write_snapshot(path: Path, settings_module_name: str, environ: dict[str, str | None]) -> int:
+    """
+    Write a snapshot of all resolved settings in a loaded settings module.
+
+    The environment variables which were read while resolving them must also be given, as
+    recorded by an "EnvironRecorder". Return the number of settings written.
+    """
+    # This is only needed when writing, so don't slow down imports for every other process
+    import tempfile
+
+    settings_module = sys.modules[settings_module_name]
+    settings = {
+        name: getattr(settings_module, name)
+        for name in dir(settings_module)
+        # "CONFIGURATION" is set by the django-configurations loader itself
+        if isuppercase(name) and name != "CONFIGURATION"
+    }
+    snapshot = {"settings": settings, "environ": environ}
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write atomically, so concurrently starting processes never read a partial snapshot
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as snapshot_stream:
+        pickle.dump(snapshot, snapshot_stream, protocol=pickle.HIGHEST_PROTOCOL)
+    # Snapshots contain secrets, so they must not be readable by other users;
+    # NamedTemporaryFile already creates files with 0600 permissions
+    os.replace(snapshot_stream.name, path)
+    return len(settings)
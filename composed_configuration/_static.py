@@ -53,22 +53,15 @@ class WhitenoiseStaticFileMixin(StaticFileMixin):
 
     @staticmethod
     def mutate_configuration(configuration: type[ComposedConfiguration]) -> None:
-        # Insert immediately before staticfiles app
-        staticfiles_index = configuration.INSTALLED_APPS.index("django.contrib.staticfiles")
-        configuration.INSTALLED_APPS.insert(staticfiles_index, "whitenoise.runserver_nostatic")
-
-        # Insert immediately after SecurityMiddleware
-        try:
-            security_index = configuration.MIDDLEWARE.index(
-                "django.middleware.security.SecurityMiddleware"
-            )
-        except ValueError:
-            raise Exception(
-                "WhitenoiseStaticFileMixin must be loaded after "
-                "the SecurityMiddleware is added to MIDDLEWARE."
-            )
-        configuration.MIDDLEWARE.insert(
-            security_index + 1, "whitenoise.middleware.WhiteNoiseMiddleware"
+        # Place immediately before staticfiles app
+        configuration.order_entry(
+            "INSTALLED_APPS", "whitenoise.runserver_nostatic", before="django.contrib.staticfiles"
+        )
+        # Place immediately after SecurityMiddleware
+        configuration.order_entry(
+            "MIDDLEWARE",
+            "whitenoise.middleware.WhiteNoiseMiddleware",
+            after="django.middleware.security.SecurityMiddleware",
         )
 
         configuration.STORAGES.update(
@@ -2,6 +2,8 @@ import os.path
 
 from configurations import values
 
+from ._profile import profile
+
 
 class DirectoryPathValue(values.PathValue):
     """A PathValue requiring that its path is a directory, optionally creating it if necessary."""
@@ -12,10 +14,12 @@ class DirectoryPathValue(values.PathValue):
         self.ensure_exists = ensure_exists
         super().__init__(*args, **kwargs)
 
-    def setup(self, name: str) -> str:
-        value = super().setup(name)
-        if os.path.exists(value) and not os.path.isdir(value):
-            raise ValueError(f"Path {repr(value)} is not a directory.")
-        if self.ensure_exists:
-            os.makedirs(value, exist_ok=True)
+    def setup(self, name: str | None) -> str:
+        # Eagerly-bound instances are set up with no name
+        with profile("value", name or type(self).__name__):
+            value = super().setup(name)
+            if os.path.exists(value) and not os.path.isdir(value):
+                raise ValueError(f"Path {repr(value)} is not a directory.")
+            if self.ensure_exists:
+                os.makedirs(value, exist_ok=True)
         return value
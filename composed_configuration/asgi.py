@@ -0,0 +1,17 @@
+from django.core.handlers.asgi import ASGIHandler
+
+
+def get_asgi_application() -> ASGIHandler:
+    """
+    Set up Django and return an ASGI application, like Django's own `get_asgi_application`.
+
+    If the `WARMUP` setting is enabled, this also loads everything which would otherwise be loaded
+    by the first request.
+    """
+    from django.core.asgi import get_asgi_application
+
+    from ._django_support.warmup import warmup_if_enabled
+
+    application = get_asgi_application()
+    warmup_if_enabled()
+    return application
@@ -0,0 +1,17 @@
+from django.core.handlers.wsgi import WSGIHandler
+
+
+def get_wsgi_application() -> WSGIHandler:
+    """
+    Set up Django and return a WSGI application, like Django's own `get_wsgi_application`.
+
+    If the `WARMUP` setting is enabled, this also loads everything which would otherwise be loaded
+    by the first request.
+    """
+    from django.core.wsgi import get_wsgi_application
+
+    from ._django_support.warmup import warmup_if_enabled
+
+    application = get_wsgi_application()
+    warmup_if_enabled()
+    return application
@@ -0,0 +1,31 @@
+import os
+from unittest import mock
+
+from configurations import importer
+import django
+from django.conf import settings
+
+# Importing the package requires the django-configurations importer to be installed. It only
+# validates that a settings module and configuration are named, so placeholders are named while
+# installing it, and are never imported.
+with mock.patch.dict(
+    os.environ,
+    {"DJANGO_SETTINGS_MODULE": "__test_settings__", "DJANGO_CONFIGURATION": "TestConfiguration"},
+):
+    importer.install()
+
+
+def pytest_configure(config) -> None:
+    # Tests of individual components only need a minimal Django project, not a full configuration
+    settings.configure(
+        INSTALLED_APPS=[
+            "django.contrib.auth",
+            "django.contrib.contenttypes",
+            "rest_framework",
+            "oauth2_provider",
+            "composed_configuration._rest_framework_support.apps.RestFrameworkSupportConfig",
+        ],
+        DATABASES={"default": {"ENGINE": "django.db.backends.sqlite3", "NAME": ":memory:"}},
+        USE_TZ=True,
+    )
+    django.setup()
@@ -0,0 +1,245 @@
+import pickle
+import sys
+from types import SimpleNamespace
+import zlib
+
+from django.core.cache import caches
+from django.test import override_settings
+import pytest
+
+from composed_configuration._cache import parse_cache_url
+from composed_configuration._cache_support.serializers import CompressingRedisSerializer
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        (
+            "redis://redis:6379/0",
+            {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "redis://redis:6379/0",
+            },
+        ),
+        (
+            "rediss://:password@redis:6380/1",
+            {
+                "BACKEND": "django.core.cache.backends.redis.RedisCache",
+                "LOCATION": "rediss://:password@redis:6380/1",
+            },
+        ),
+        (
+            "memcached://memcached1:11211,memcached2:11211",
+            {
+                "BACKEND": "django.core.cache.backends.memcached.PyMemcacheCache",
+                "LOCATION": ["memcached1:11211", "memcached2:11211"],
+            },
+        ),
+        (
+            "memcached:///run/memcached.sock",
+            {
+                "BACKEND": "django.core.cache.backends.memcached.PyMemcacheCache",
+                "LOCATION": "unix:/run/memcached.sock",
+            },
+        ),
+        (
+            "locmem://",
+            {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": ""},
+        ),
+        (
+            "locmem://test-location",
+            {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test-location",
+            },
+        ),
+    ],
+)
+def test_parse_cache_url(url, expected):
+    assert parse_cache_url(url) == expected
+
+
+@pytest.mark.parametrize("url", ["http://cache", "cache"])
+def test_parse_cache_url_unsupported(url):
+    with pytest.raises(ValueError, match="does not have a supported scheme"):
+        parse_cache_url(url)
+
+
+# Like zstandard, but backed by zlib
+_fake_zstd = SimpleNamespace(compress=zlib.compress, decompress=zlib.decompress)
+
+
+@pytest.fixture
+def zstandard_only(monkeypatch):
+    """Make "compression.zstd" unavailable, as before Python 3.14, but "zstandard" installed."""
+    monkeypatch.setitem(sys.modules, "compression", None)
+    monkeypatch.setitem(sys.modules, "zstandard", _fake_zstd)
+
+
+@pytest.fixture
+def no_zstd(monkeypatch):
+    monkeypatch.setitem(sys.modules, "compression", None)
+    monkeypatch.setitem(sys.modules, "zstandard", None)
+
+
+def _serializer(algorithm: str) -> CompressingRedisSerializer:
+    with override_settings(CACHE_COMPRESSION=algorithm, CACHE_COMPRESSION_THRESHOLD=100):
+        return CompressingRedisSerializer()
+
+
+@pytest.mark.parametrize(("algorithm", "marker"), [("zlib", b"\x01"), ("zstd", b"\x02")])
+def test_serializer_compressed(zstandard_only, algorithm, marker):
+    serializer = _serializer(algorithm)
+    value = {"data": "x" * 1000}
+
+    data = serializer.dumps(value)
+
+    assert data[:1] == marker
+    assert len(data) < len(pickle.dumps(value))
+    assert serializer.loads(data) == value
+
+
+@pytest.mark.parametrize("algorithm", ["zlib", "zstd"])
+def test_serializer_uncompressed(zstandard_only, algorithm):
+    serializer = _serializer(algorithm)
+    value = {"data": "x"}
+
+    data = serializer.dumps(value)
+
+    # Small values are only pickled
+    assert data == pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    assert serializer.loads(data) == value
+
+
+def test_serializer_integer(zstandard_only):
+    serializer = _serializer("zlib")
+
+    # Integers are stored unpickled, so Redis can increment them
+    assert serializer.dumps(10**200) == 10**200
+
+
+def test_serializer_changed_algorithm(zstandard_only):
+    value = "x" * 1000
+
+    data = _serializer("zstd").dumps(value)
+
+    # Values which were compressed with another algorithm are still readable
+    assert _serializer("zlib").loads(data) == value
+
+
+def test_serializer_zstd_missing(no_zstd):
+    with pytest.raises(ImportError):
+        _serializer("zstd")
+
+    # zlib compression doesn't require zstd
+    serializer = _serializer("zlib")
+    value = "x" * 1000
+    assert serializer.loads(serializer.dumps(value)) == value
+
+
+@pytest.fixture
+def tiered_cache():
+    """Return a tiered cache, with local and shared caches which are both in-memory."""
+    with override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "composed_configuration._cache_support.backends.TieredCache",
+                "OPTIONS": {"LOCAL_ALIAS": "local", "SHARED_ALIAS": "shared"},
+            },
+            "local": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test-local",
+                "TIMEOUT": 10,
+            },
+            "shared": {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": "test-shared",
+            },
+        }
+    ):
+        yield caches["default"]
+        caches["local"].clear()
+        caches["shared"].clear()
+
+
+def test_tiered_read_through(tiered_cache):
+    caches["shared"].set("key", "value")
+
+    assert tiered_cache.get("key") == "value"
+    # The value is now kept locally
+    assert caches["local"].get("key") == "value"
+
+
+def test_tiered_read_local(tiered_cache):
+    tiered_cache.set("key", "value")
+    # Writes by other processes are not seen until the local copy expires
+    caches["shared"].set("key", "other value")
+
+    assert tiered_cache.get("key") == "value"
+
+
+def test_tiered_read_missing(tiered_cache):
+    assert tiered_cache.get("key", "default") == "default"
+    assert not caches["local"].has_key("key")
+
+
+def test_tiered_read_many(tiered_cache):
+    caches["local"].set("key1", "value1")
+    caches["shared"].set("key2", "value2")
+
+    assert tiered_cache.get_many(["key1", "key2", "key3"]) == {"key1": "value1", "key2": "value2"}
+    assert caches["local"].get("key2") == "value2"
+
+
+def test_tiered_set(tiered_cache):
+    caches["local"].set("key", "stale value")
+
+    tiered_cache.set("key", "value")
+
+    assert caches["local"].get("key") == "value"
+    assert caches["shared"].get("key") == "value"
+
+
+def test_tiered_set_local_timeout(tiered_cache):
+    tiered_cache.set("short", "value", timeout=5)
+    tiered_cache.set("long", "value", timeout=60)
+
+    local = caches["local"]
+    # Local copies never outlive the shared values, nor the local timeout
+    assert local._expire_info[local.make_key("short")] == pytest.approx(
+        caches["shared"]._expire_info[caches["shared"].make_key("short")], abs=1
+    )
+    assert local._expire_info[local.make_key("long")] == pytest.approx(
+        local._expire_info[local.make_key("short")] + 5, abs=1
+    )
+
+
+def test_tiered_delete(tiered_cache):
+    tiered_cache.set("key", "value")
+
+    tiered_cache.delete("key")
+
+    assert not caches["local"].has_key("key")
+    assert not caches["shared"].has_key("key")
+    assert tiered_cache.get("key") is None
+
+
+def test_tiered_add_existing(tiered_cache):
+    caches["local"].set("key", "stale value")
+    caches["shared"].set("key", "value")
+
+    assert not tiered_cache.add("key", "new value")
+
+    # The local copy may have been stale, so it's dropped
+    assert not caches["local"].has_key("key")
+    assert tiered_cache.get("key") == "value"
+
+
+def test_tiered_incr(tiered_cache):
+    tiered_cache.set("counter", 1)
+
+    assert tiered_cache.incr("counter") == 2
+
+    # Counters are only read from the shared cache afterwards
+    assert not caches["local"].has_key("counter")
+    assert tiered_cache.get("counter") == 2
@@ -0,0 +1,71 @@
+import time
+
+from celery import Celery
+from celery.signals import before_task_publish
+import pytest
+
+from composed_configuration._celery_support.instrumentation import (
+    READY_AT_HEADER,
+    _on_before_task_publish,
+)
+
+
+@pytest.fixture
+def published_headers():
+    """Return a function which publishes a task to an in-memory broker, and returns its headers."""
+    app = Celery("test", broker="memory://", set_as_current=False)
+
+    @app.task(name="test_task")
+    def task() -> None:
+        pass
+
+    headers_list: list[dict] = []
+
+    def on_before_task_publish(headers, **kwargs):
+        _on_before_task_publish(headers)
+        headers_list.append(headers)
+
+    before_task_publish.connect(on_before_task_publish, weak=False)
+    try:
+
+        def publish(**options) -> dict:
+            task.apply_async(**options)
+            return headers_list[-1]
+
+        yield publish
+    finally:
+        before_task_publish.disconnect(on_before_task_publish)
+
+
+def test_ready_at_published(published_headers):
+    before = time.time()
+
+    headers = published_headers()
+
+    assert before <= headers[READY_AT_HEADER] <= time.time()
+
+
+def test_ready_at_countdown(published_headers):
+    before = time.time()
+
+    headers = published_headers(countdown=60)
+
+    # The task is not waiting in the queue until its countdown elapses
+    assert before + 60 <= headers[READY_AT_HEADER] <= time.time() + 60
+
+
+def test_ready_at_republished():
+    # A retried task's headers may include the previous attempt's time, which must be reset
+    headers = {"eta": None, READY_AT_HEADER: 0.0}
+
+    _on_before_task_publish(headers)
+
+    assert headers[READY_AT_HEADER] > 0.0
+
+
+def test_ready_at_naive_eta():
+    headers = {"eta": "2100-01-01T00:00:00"}
+
+    _on_before_task_publish(headers)
+
+    assert headers[READY_AT_HEADER] == 4102444800.0
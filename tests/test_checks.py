@@ -0,0 +1,30 @@
+from django.test import override_settings
+
+from composed_configuration._rest_framework_support.checks import check_throttle_cache
+
+THROTTLE_SETTINGS = {
+    "DEFAULT_THROTTLE_CLASSES": [
+        "composed_configuration._rest_framework_support.throttling.AnonRateThrottle"
+    ],
+    "DEFAULT_THROTTLE_RATES": {"anon": "100/minute"},
+}
+
+
+@override_settings(REST_FRAMEWORK=THROTTLE_SETTINGS)
+def test_check_throttle_cache_local():
+    assert [message.id for message in check_throttle_cache()] == ["composed_configuration.W005"]
+
+
+@override_settings(
+    REST_FRAMEWORK=THROTTLE_SETTINGS,
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache"}},
+)
+def test_check_throttle_cache_shared():
+    assert check_throttle_cache() == []
+
+
+@override_settings(
+    REST_FRAMEWORK={**THROTTLE_SETTINGS, "DEFAULT_THROTTLE_RATES": {"anon": None}},
+)
+def test_check_throttle_cache_disabled():
+    assert check_throttle_cache() == []
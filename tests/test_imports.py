@@ -0,0 +1,92 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Importing any of these takes tens of milliseconds, and only some mixins need them, so the package
+# root must never import them. Django itself is always imported, by the django-configurations
+# importer.
+HEAVY_PACKAGES = [
+    "allauth",
+    "celery",
+    "corsheaders",
+    "drf_yasg",
+    "kombu",
+    "oauth2_provider",
+    "psycopg",
+    "rest_framework",
+    "sentry_sdk",
+    "storages",
+    "whitenoise",
+]
+
+_MARKER = "composed-configuration-import-start"
+
+
+def _imported_modules(statement: str) -> list[str]:
+    """
+    Return the modules imported by a statement, as reported by "python -X importtime".
+
+    This includes the modules imported by installing the django-configurations importer, which
+    must always precede the statement.
+    """
+    # Only modules imported after the interpreter's own startup are reported
+    code = (
+        "import sys\n"
+        f"print({_MARKER!r}, file=sys.stderr, flush=True)\n"
+        "from configurations import importer\n"
+        "importer.install()\n"
+        f"{statement}\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env={
+            **os.environ,
+            # These are only validated by the django-configurations importer, not imported
+            "DJANGO_SETTINGS_MODULE": "__test_settings__",
+            "DJANGO_CONFIGURATION": "TestConfiguration",
+        },
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    lines = result.stderr.splitlines()
+    # Lines are formatted as "import time: <self us> | <cumulative us> | <indented module name>"
+    return [
+        line.split("|")[2].strip()
+        for line in lines[lines.index(_MARKER) + 1 :]
+        if line.startswith("import time:")
+    ]
+
+
+def _heavy_modules(modules: list[str]) -> list[str]:
+    return [
+        module
+        for module in modules
+        if any(module == package or module.startswith(f"{package}.") for package in HEAVY_PACKAGES)
+    ]
+
+
+def test_import_package_root():
+    modules = _imported_modules("import composed_configuration")
+
+    assert "composed_configuration" in modules
+    # Ensure that imports by the importer are reported
+    assert "django" in modules
+    assert _heavy_modules(modules) == []
+
+
+@pytest.mark.parametrize(
+    "name, unexpected_module",
+    [
+        ("CeleryMixin", "composed_configuration._rest_framework"),
+        ("RestFrameworkMixin", "composed_configuration._celery"),
+        ("DjangoMixin", "composed_configuration._configuration"),
+    ],
+)
+def test_import_mixin_lazily(name, unexpected_module):
+    modules = _imported_modules(f"from composed_configuration import {name}")
+
+    assert unexpected_module not in modules
+    assert _heavy_modules(modules) == []
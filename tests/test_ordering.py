@@ -0,0 +1,175 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.core.exceptions import ImproperlyConfigured
+import pytest
+
+from composed_configuration._ordering import order_entries
+
+# These are the stacks of the configurations before their order was resolved declaratively, plus
+# the support apps and middleware added since
+DEVELOPMENT_INSTALLED_APPS = [
+    "auth_style",
+    "django.contrib.admin",
+    "composed_configuration._allauth_support.apps.AllauthSupportConfig",
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.humanize",
+    "composed_configuration._django_support.apps.DjangoSupportConfig",
+    "django.contrib.sites",
+    "allauth",
+    "allauth.account",
+    "allauth.socialaccount",
+    "django.contrib.postgres",
+    "composed_configuration._database_support.apps.DatabaseSupportConfig",
+    "whitenoise.runserver_nostatic",
+    "django.contrib.staticfiles",
+    "corsheaders",
+    "django_filters",
+    "rest_framework",
+    "rest_framework.authtoken",
+    "oauth2_provider",
+    "drf_yasg",
+    "composed_configuration._rest_framework_support.apps.RestFrameworkSupportConfig",
+    "composed_configuration._celery_support.apps.CelerySupportConfig",
+    "django_extensions",
+    "girder_utils",
+    "debug_toolbar",
+]
+
+DEVELOPMENT_MIDDLEWARE = [
+    "debug_toolbar.middleware.DebugToolbarMiddleware",
+    "django.middleware.security.SecurityMiddleware",
+    "corsheaders.middleware.CorsMiddleware",
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "allauth.account.middleware.AccountMiddleware",
+    "composed_configuration._database_support.instrumentation.QueryInstrumentationMiddleware",
+]
+
+PRODUCTION_INSTALLED_APPS = [
+    "auth_style",
+    "django.contrib.admin",
+    "composed_configuration._allauth_support.apps.AllauthSupportConfig",
+    "django.contrib.auth",
+    "django.contrib.contenttypes",
+    "django.contrib.sessions",
+    "django.contrib.messages",
+    "django.contrib.humanize",
+    "composed_configuration._django_support.apps.DjangoSupportConfig",
+    "django.contrib.sites",
+    "allauth",
+    "allauth.account",
+    "allauth.socialaccount",
+    "django.contrib.postgres",
+    "composed_configuration._database_support.apps.DatabaseSupportConfig",
+    "whitenoise.runserver_nostatic",
+    "django.contrib.staticfiles",
+    "corsheaders",
+    "django_filters",
+    "rest_framework",
+    "rest_framework.authtoken",
+    "oauth2_provider",
+    "drf_yasg",
+    "composed_configuration._rest_framework_support.apps.RestFrameworkSupportConfig",
+    "composed_configuration._celery_support.apps.CelerySupportConfig",
+    "django_extensions",
+    "girder_utils",
+    "composed_configuration.sentry.apps.SentryConfig",
+]
+
+PRODUCTION_MIDDLEWARE = [
+    "django.middleware.security.SecurityMiddleware",
+    "corsheaders.middleware.CorsMiddleware",
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "django.contrib.sessions.middleware.SessionMiddleware",
+    "django.middleware.common.CommonMiddleware",
+    "django.middleware.csrf.CsrfViewMiddleware",
+    "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "django.contrib.messages.middleware.MessageMiddleware",
+    "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "allauth.account.middleware.AccountMiddleware",
+    "composed_configuration._database_support.instrumentation.QueryInstrumentationMiddleware",
+]
+
+
+def test_order_entries_before():
+    assert order_entries("SETTING", ["a", "b", "c"], {"c": ("before", "a")}) == ["c", "a", "b"]
+
+
+def test_order_entries_after():
+    assert order_entries("SETTING", ["a", "b", "c"], {"a": ("after", "b")}) == ["b", "a", "c"]
+
+
+def test_order_entries_anchor_placed_first():
+    # "b" is placed relative to "c", which must be moved first
+    assert order_entries(
+        "SETTING", ["a", "b", "c"], {"b": ("after", "c"), "c": ("before", "a")}
+    ) == ["c", "b", "a"]
+
+
+def test_order_entries_deduplicate():
+    assert order_entries("SETTING", ["a", "b", "a", "c", "b"], {}) == ["a", "b", "c"]
+
+
+def test_order_entries_missing_anchor():
+    with pytest.raises(ImproperlyConfigured, match='"a" must be placed after "z"'):
+        order_entries("SETTING", ["a", "b"], {"a": ("after", "z")})
+
+
+def test_order_entries_circular():
+    with pytest.raises(ImproperlyConfigured, match="circular"):
+        order_entries("SETTING", ["a", "b"], {"a": ("after", "b"), "b": ("after", "a")})
+
+
+def _resolved_stacks(configuration_name: str) -> dict[str, list[str]]:
+    # Resolving mutates the configuration classes, so do it in a separate interpreter
+    code = (
+        "import json\n"
+        "from configurations import importer\n"
+        "importer.install()\n"
+        "import composed_configuration\n"
+        f"base = composed_configuration.{configuration_name}\n"
+        "configuration = type('Configuration', (base,), {'__module__': __name__})\n"
+        "configuration.pre_setup()\n"
+        "print(json.dumps({'INSTALLED_APPS': configuration.INSTALLED_APPS, "
+        "'MIDDLEWARE': configuration.MIDDLEWARE}))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        env={
+            **{name: value for name, value in os.environ.items() if not name.startswith("DJANGO_")},
+            # These are only validated by the django-configurations importer, not imported
+            "DJANGO_SETTINGS_MODULE": "__test_settings__",
+            "DJANGO_CONFIGURATION": "TestConfiguration",
+            # This is read while mutating
+            "DJANGO_EMAIL_URL": "smtp://localhost:25",
+        },
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+@pytest.mark.parametrize(
+    "configuration_name, installed_apps, middleware",
+    [
+        ("DevelopmentBaseConfiguration", DEVELOPMENT_INSTALLED_APPS, DEVELOPMENT_MIDDLEWARE),
+        ("ProductionBaseConfiguration", PRODUCTION_INSTALLED_APPS, PRODUCTION_MIDDLEWARE),
+    ],
+)
+def test_resolved_stacks(configuration_name, installed_apps, middleware):
+    stacks = _resolved_stacks(configuration_name)
+
+    assert stacks["INSTALLED_APPS"] == installed_apps
+    assert stacks["MIDDLEWARE"] == middleware
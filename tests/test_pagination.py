@@ -0,0 +1,52 @@
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import override_settings
+import pytest
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from composed_configuration._rest_framework_support.pagination import (
+    EstimatedCountLimitOffsetPagination,
+    estimate_count,
+)
+
+
+@pytest.mark.parametrize(
+    "queryset",
+    [User.objects.none(), User.objects.filter(pk__in=[])],
+    ids=["none", "empty_in"],
+)
+def test_estimate_count_empty_result(queryset):
+    # No query is run, so no PostgreSQL database is needed
+    with mock.patch.object(connection, "vendor", "postgresql"):
+        assert estimate_count(queryset) == 0
+
+
+@pytest.mark.django_db
+def test_estimated_count_pagination_fallback():
+    User.objects.create(username="a")
+    User.objects.create(username="b")
+    paginator = EstimatedCountLimitOffsetPagination()
+    request = Request(APIRequestFactory().get("/", {"limit": 1}))
+
+    page = paginator.paginate_queryset(User.objects.order_by("pk"), request)
+
+    assert len(page) == 1
+    assert paginator.count == 2
+
+
+@pytest.mark.django_db
+@override_settings(API_ESTIMATED_COUNT_THRESHOLD=10)
+@pytest.mark.parametrize("estimated_count, count", [(None, 2), (5, 2), (20, 20)])
+def test_estimated_count_pagination(estimated_count, count):
+    User.objects.create(username="a")
+    User.objects.create(username="b")
+    paginator = EstimatedCountLimitOffsetPagination()
+
+    with mock.patch(
+        "composed_configuration._rest_framework_support.pagination.estimate_count",
+        return_value=estimated_count,
+    ):
+        assert paginator.get_count(User.objects.all()) == count
@@ -0,0 +1,150 @@
+import logging
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.exceptions import MiddlewareNotUsed
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+import pytest
+
+from composed_configuration._database_support import instrumentation
+from composed_configuration._database_support.instrumentation import (
+    QueryInstrumentationMiddleware,
+    QueryStats,
+    record_queries,
+)
+
+pytestmark = pytest.mark.django_db
+
+
+def _query_users(count: int) -> None:
+    """Make an N+1 query pattern, with a different parameter for each query."""
+    for pk in range(count):
+        User.objects.filter(pk=pk).exists()
+
+
+def _repeated_warnings(caplog) -> list[logging.LogRecord]:
+    return [record for record in caplog.records if record.levelno == logging.WARNING]
+
+
+def test_record_queries():
+    with record_queries() as stats:
+        _query_users(3)
+        User.objects.count()
+
+    assert stats.count == 4
+    assert stats.seconds > 0
+    # Parameters are not part of the SQL, so each query with the same shape is counted together
+    assert sorted(stats.sql_counts.values()) == [1, 3]
+
+
+def test_query_stats_failed_query():
+    stats = QueryStats()
+
+    def execute(sql, params, many, context):
+        raise ValueError
+
+    with pytest.raises(ValueError):
+        stats(execute, "SELECT %s", [1], False, {})
+
+    # Failed queries still took time
+    assert stats.count == 1
+    assert stats.sql_counts == {"SELECT %s": 1}
+
+
+def test_record_queries_stops():
+    with record_queries() as stats:
+        pass
+    _query_users(1)
+
+    assert stats.count == 0
+
+
+def test_repeated_shapes_normalizes_parameter_lists():
+    with record_queries() as stats:
+        for length in range(2, 5):
+            list(User.objects.filter(pk__in=range(length)))
+
+    # These differ in their number of placeholders, but have the same shape
+    assert len(stats.sql_counts) == 3
+    ((shape, count),) = stats.repeated_shapes(3)
+    assert count == 3
+    assert "IN (%s, ...)" in shape
+
+
+@override_settings(DATABASE_QUERY_REPEAT_THRESHOLD=5)
+@pytest.mark.parametrize(("query_count", "warned"), [(4, False), (5, True), (6, True)])
+def test_report_repeated(caplog, query_count, warned):
+    with record_queries() as stats:
+        _query_users(query_count)
+
+    with caplog.at_level(logging.INFO, logger=instrumentation.__name__):
+        stats.report("test_label")
+
+    assert caplog.records[0].query_count == query_count
+    warnings = _repeated_warnings(caplog)
+    if warned:
+        (warning,) = warnings
+        assert warning.query_count == query_count
+        assert warning.query_label == "test_label"
+        assert warning.query_shape.startswith("SELECT")
+    else:
+        assert not warnings
+
+
+@override_settings(DATABASE_QUERY_SAMPLE_RATE=0.0)
+def test_middleware_disabled():
+    with pytest.raises(MiddlewareNotUsed):
+        QueryInstrumentationMiddleware(lambda request: HttpResponse())
+
+
+@override_settings(DATABASE_QUERY_SAMPLE_RATE=1.0, DATABASE_QUERY_REPEAT_THRESHOLD=5)
+def test_middleware(caplog):
+    def get_response(request):
+        _query_users(5)
+        return HttpResponse()
+
+    middleware = QueryInstrumentationMiddleware(get_response)
+    with caplog.at_level(logging.INFO, logger=instrumentation.__name__):
+        middleware(RequestFactory().get("/test/path/"))
+
+    assert caplog.records[0].query_label == "/test/path/"
+    assert caplog.records[0].query_count == 5
+    (warning,) = _repeated_warnings(caplog)
+    assert warning.query_count == 5
+
+
+@override_settings(DATABASE_QUERY_SAMPLE_RATE=0.5, DATABASE_QUERY_REPEAT_THRESHOLD=5)
+@pytest.mark.parametrize(("random_value", "sampled"), [(0.4, True), (0.5, False)])
+def test_middleware_sampling(caplog, random_value, sampled):
+    def get_response(request):
+        _query_users(5)
+        return HttpResponse()
+
+    middleware = QueryInstrumentationMiddleware(get_response)
+    with (
+        mock.patch.object(instrumentation.random, "random", return_value=random_value),
+        caplog.at_level(logging.INFO, logger=instrumentation.__name__),
+    ):
+        middleware(RequestFactory().get("/"))
+
+    assert bool(caplog.records) is sampled
+
+
+@override_settings(DATABASE_QUERY_SAMPLE_RATE=1.0, DATABASE_QUERY_REPEAT_THRESHOLD=5)
+def test_task_instrumentation(caplog):
+    task = mock.Mock()
+    task.name = "test_task"
+
+    with caplog.at_level(logging.INFO, logger=instrumentation.__name__):
+        instrumentation._on_task_prerun(task_id="test-task-id")
+        _query_users(5)
+        instrumentation._on_task_postrun(task_id="test-task-id", task=task)
+        # Queries after the task are not recorded
+        _query_users(1)
+
+    assert caplog.records[0].query_label == "test_task"
+    assert caplog.records[0].query_count == 5
+    (warning,) = _repeated_warnings(caplog)
+    assert warning.query_count == 5
+    assert not instrumentation._task_recordings
@@ -0,0 +1,64 @@
+import datetime
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.utils import timezone
+from oauth2_provider.models import AccessToken
+import pytest
+
+from composed_configuration._rest_framework_support.oauth2_validators import (
+    access_token_cache_key,
+    token_checksum,
+)
+
+
+@pytest.fixture
+def user():
+    return User.objects.create(username="user")
+
+
+@pytest.fixture
+def cached_token_key(user):
+    access_token = AccessToken.objects.create(
+        user=user, token="token", expires=timezone.now() + datetime.timedelta(hours=1)
+    )
+    cache_key = access_token_cache_key(token_checksum(access_token.token))
+    cache.set(cache_key, access_token)
+    yield cache_key
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_invalidate_on_user_deactivation(user, cached_token_key):
+    user.is_active = False
+    user.save(update_fields=["is_active"])
+
+    assert cache.get(cached_token_key) is None
+
+
+@pytest.mark.django_db
+def test_invalidate_on_user_full_save(user, cached_token_key):
+    user.save()
+
+    assert cache.get(cached_token_key) is None
+
+
+@pytest.mark.django_db
+def test_no_invalidate_on_user_login(user, cached_token_key, django_assert_num_queries):
+    user.last_login = timezone.now()
+    # Only the update itself is queried
+    with django_assert_num_queries(1):
+        user.save(update_fields=["last_login"])
+
+    assert cache.get(cached_token_key) is not None
+
+
+@pytest.mark.django_db
+def test_invalidate_on_commit(user, cached_token_key, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        user.delete()
+        assert cache.get(cached_token_key) is None
+        # Another process may cache the token again before the deletion is committed
+        cache.set(cached_token_key, "stale")
+
+    assert cache.get(cached_token_key) is None
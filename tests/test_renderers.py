@@ -0,0 +1,29 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from composed_configuration._rest_framework_support.renderers import ORJSONRenderer
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"string": "a", "integer": 1, "float": 1.5, "boolean": True, "none": None, "list": [1, 2]},
+        {"decimal": Decimal("1.10")},
+        {"separators": "\u2028\u2029"},
+        {1: "integer key", 2.5: "float key", None: "none key"},
+        {"large": 2**70, "small": -(2**70)},
+        {"aware": datetime.datetime(2020, 1, 2, 3, 4, 5, 678901, tzinfo=datetime.timezone.utc)},
+        {"naive": datetime.datetime(2020, 1, 2, 3, 4, 5, 678901)},
+        {"date": datetime.date(2020, 1, 2), "time": datetime.time(3, 4, 5, 678901)},
+    ],
+)
+def test_orjson_renderer_matches_json_renderer(data):
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_orjson_renderer_unserializable():
+    with pytest.raises(TypeError):
+        ORJSONRenderer().render({"object": object()})
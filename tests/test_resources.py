@@ -0,0 +1,225 @@
+from pathlib import Path
+
+import pytest
+
+from composed_configuration._resources import (
+    MIN_MEMORY_PER_CHILD,
+    cgroup_cpu_limit,
+    cgroup_memory_limit,
+    default_worker_concurrency,
+    default_worker_max_memory_per_child,
+    effective_cpu_count,
+)
+
+MIB = 1024 * 1024
+
+
+@pytest.fixture
+def cgroup_root(tmp_path: Path):
+    """Return a function which writes files into a fake filesystem root."""
+
+    def write_files(files: dict[str, str]) -> Path:
+        for relative_path, content in files.items():
+            path = tmp_path / relative_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(content)
+        return tmp_path
+
+    return write_files
+
+
+def test_cgroup_v2_limited(cgroup_root):
+    root = cgroup_root(
+        {
+            "proc/self/cgroup": "0::/\n",
+            "sys/fs/cgroup/cpu.max": "150000 100000\n",
+            "sys/fs/cgroup/memory.max": f"{512 * MIB}\n",
+        }
+    )
+
+    assert cgroup_cpu_limit(root) == 1.5
+    assert cgroup_memory_limit(root) == 512 * MIB
+    assert effective_cpu_count(root) <= 2
+
+
+def test_cgroup_v2_unlimited(cgroup_root):
+    root = cgroup_root(
+        {
+            "proc/self/cgroup": "0::/\n",
+            "sys/fs/cgroup/cpu.max": "max 100000\n",
+            "sys/fs/cgroup/memory.max": "max\n",
+        }
+    )
+
+    assert cgroup_cpu_limit(root) is None
+    assert cgroup_memory_limit(root) is None
+    assert default_worker_max_memory_per_child(4, 0, root) is None
+
+
+def test_cgroup_v2_nested(cgroup_root):
+    # The process's own cgroup is unlimited, but its parent is limited
+    root = cgroup_root(
+        {
+            "proc/self/cgroup": "0::/parent/child\n",
+            "sys/fs/cgroup/parent/cpu.max": "50000 100000\n",
+            "sys/fs/cgroup/parent/memory.max": f"{256 * MIB}\n",
+            "sys/fs/cgroup/parent/child/cpu.max": "max 100000\n",
+            "sys/fs/cgroup/parent/child/memory.max": "max\n",
+        }
+    )
+
+    assert cgroup_cpu_limit(root) == 0.5
+    assert cgroup_memory_limit(root) == 256 * MIB
+    assert effective_cpu_count(root) == 1
+
+
+def test_cgroup_v2_nested_smallest_limit(cgroup_root):
+    root = cgroup_root(
+        {
+            "proc/self/cgroup": "0::/parent/child\n",
+            "sys/fs/cgroup/parent/cpu.max": "400000 100000\n",
+            "sys/fs/cgroup/parent/memory.max": f"{2048 * MIB}\n",
+            "sys/fs/cgroup/parent/child/cpu.max": "200000 100000\n",
+            "sys/fs/cgroup/parent/child/memory.max": f"{1024 * MIB}\n",
+        }
+    )
+
+    assert cgroup_cpu_limit(root) == 2.0
+    assert cgroup_memory_limit(root) == 1024 * MIB
+
+
+def test_cgroup_v1_limited(cgroup_root):
+    root = cgroup_root(
+        {
+            "proc/self/cgroup": "4:cpu,cpuacct:/docker/abc\n3:memory:/docker/abc\n",
+            "sys/fs/cgroup/cpu,cpuacct/docker/abc/cpu.cfs_quota_us": "200000\n",
+            "sys/fs/cgroup/cpu,cpuacct/docker/abc/cpu.cfs_period_us": "100000\n",
+            "sys/fs/cgroup/memory/docker/abc/memory.limit_in_bytes": f"{1024 * MIB}\n",
+        }
+    )
+
+    assert cgroup_cpu_limit(root) == 2.0
+    assert cgroup_memory_limit(root) == 1024 * MIB
+
+
+def test_cgroup_v1_unlimited(cgroup_root):
+    root = cgroup_root(
+        {
+            "proc/self/cgroup": "4:cpu,cpuacct:/\n3:memory:/\n",
+            "sys/fs/cgroup/cpu,cpuacct/cpu.cfs_quota_us": "-1\n",
+            "sys/fs/cgroup/cpu,cpuacct/cpu.cfs_period_us": "100000\n",
+            # Unlimited is reported as a very large number, rounded to the page size
+            "sys/fs/cgroup/memory/memory.limit_in_bytes": "9223372036854771712\n",
+        }
+    )
+
+    assert cgroup_cpu_limit(root) is None
+    assert cgroup_memory_limit(root) is None
+
+
+def test_cgroup_v1_unlimited_cpu_quota(cgroup_root):
+    root = cgroup_root(
+        {
+            "proc/self/cgroup": "4:cpu,cpuacct:/\n3:memory:/\n",
+            # A quota of -1 means no quota, regardless of the period
+            "sys/fs/cgroup/cpu,cpuacct/cpu.cfs_quota_us": "-1\n",
+            "sys/fs/cgroup/cpu,cpuacct/cpu.cfs_period_us": "100000\n",
+            "sys/fs/cgroup/memory/memory.limit_in_bytes": f"{1024 * MIB}\n",
+        }
+    )
+
+    assert cgroup_cpu_limit(root) is None
+    assert cgroup_memory_limit(root) == 1024 * MIB
+
+
+@pytest.mark.parametrize(
+    "unlimited_memory",
+    [
+        # The largest signed 64-bit integer, rounded down to 4 KiB and 64 KiB pages
+        "9223372036854771712",
+        "9223372036854710272",
+        "9223372036854775807",
+    ],
+)
+def test_cgroup_v1_unlimited_memory(cgroup_root, unlimited_memory):
+    root = cgroup_root(
+        {
+            "proc/self/cgroup": "4:cpu,cpuacct:/\n3:memory:/\n",
+            "sys/fs/cgroup/cpu,cpuacct/cpu.cfs_quota_us": "50000\n",
+            "sys/fs/cgroup/cpu,cpuacct/cpu.cfs_period_us": "100000\n",
+            "sys/fs/cgroup/memory/memory.limit_in_bytes": f"{unlimited_memory}\n",
+        }
+    )
+
+    assert cgroup_cpu_limit(root) == 0.5
+    assert cgroup_memory_limit(root) is None
+    assert default_worker_max_memory_per_child(1, 0, root) is None
+
+
+def test_cgroup_without_namespace(cgroup_root):
+    # The cgroup path is from the host's hierarchy, but only the container's cgroup is mounted
+    root = cgroup_root(
+        {
+            "proc/self/cgroup": "0::/system.slice/docker-abc.scope\n",
+            "sys/fs/cgroup/cpu.max": "100000 100000\n",
+            "sys/fs/cgroup/memory.max": f"{512 * MIB}\n",
+        }
+    )
+
+    assert cgroup_cpu_limit(root) == 1.0
+    assert cgroup_memory_limit(root) == 512 * MIB
+
+
+def test_cgroup_malformed_lines(cgroup_root):
+    root = cgroup_root(
+        {
+            "proc/self/cgroup": "\n0::/\nmalformed\n\n",
+            "sys/fs/cgroup/memory.max": f"{512 * MIB}\n",
+        }
+    )
+
+    assert cgroup_memory_limit(root) == 512 * MIB
+
+
+def test_cgroup_missing(tmp_path):
+    assert cgroup_cpu_limit(tmp_path) is None
+    assert cgroup_memory_limit(tmp_path) is None
+    assert effective_cpu_count(tmp_path) >= 1
+
+
+def test_default_worker_concurrency_memory_limited(cgroup_root):
+    root = cgroup_root(
+        {
+            "proc/self/cgroup": "0::/\n",
+            "sys/fs/cgroup/memory.max": f"{2 * MIN_MEMORY_PER_CHILD + 1}\n",
+        }
+    )
+
+    assert default_worker_concurrency(root=root) == min(effective_cpu_count(root), 2)
+    # There is always at least one child
+    assert default_worker_concurrency(min_memory_per_child=4 * MIN_MEMORY_PER_CHILD, root=root) == 1
+
+
+def test_default_worker_max_memory_per_child(cgroup_root):
+    root = cgroup_root(
+        {
+            "proc/self/cgroup": "0::/\n",
+            "sys/fs/cgroup/memory.max": f"{1000 * MIB}\n",
+        }
+    )
+
+    # 80% of the limit is divided between children, in KiB
+    assert default_worker_max_memory_per_child(4, 100 * MIB, root) == 200 * 1024
+
+
+def test_default_worker_max_memory_per_child_small_limit(cgroup_root):
+    root = cgroup_root(
+        {
+            "proc/self/cgroup": "0::/\n",
+            "sys/fs/cgroup/memory.max": f"{2 * MIN_MEMORY_PER_CHILD}\n",
+        }
+    )
+
+    # Each child would be limited to about 205 MiB, which leaves too little headroom above the
+    # memory used before running any tasks, so they'd be replaced after almost every task
+    assert default_worker_max_memory_per_child(2, 150 * MIB, root) is None
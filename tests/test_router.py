@@ -0,0 +1,146 @@
+from contextlib import ExitStack
+from types import SimpleNamespace
+from unittest import mock
+
+from celery.signals import task_prerun
+from django.core.signals import request_started
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, close_old_connections
+from django.test import override_settings
+import pytest
+
+from composed_configuration._database_support import router
+from composed_configuration._database_support.apps import DatabaseSupportConfig
+
+
+def _fake_connection(lag: float | None) -> mock.MagicMock:
+    """Return a fake connection to a replica with a replication lag, or unreachable if None."""
+    connection = mock.MagicMock()
+    cursor = connection.cursor.return_value.__enter__.return_value
+    if lag is None:
+        cursor.execute.side_effect = DatabaseError("connection refused")
+    else:
+        cursor.fetchone.return_value = (lag,)
+    return connection
+
+
+@pytest.fixture
+def make_router():
+    """Return a function which makes a router, for replicas with the given replication lags."""
+    with ExitStack() as patches:
+
+        def make_router(*lags: float | None) -> router.ReplicaRouter:
+            connections = {
+                f"{router.REPLICA_ALIAS_PREFIX}{index}": _fake_connection(lag)
+                for index, lag in enumerate(lags, start=1)
+            }
+            fake_settings = SimpleNamespace(
+                DATABASES={DEFAULT_DB_ALIAS: {}, **dict.fromkeys(connections, {})},
+                DATABASE_REPLICA_MAX_LAG=30.0,
+            )
+            patches.enter_context(mock.patch.object(router, "settings", fake_settings))
+            patches.enter_context(mock.patch.object(router, "connections", connections))
+            return router.ReplicaRouter()
+
+        # Each test starts as a new request or task would
+        router.reset_read_your_writes()
+        yield make_router
+        router.reset_read_your_writes()
+
+
+@pytest.fixture
+def connected_receivers():
+    """Connect the receivers which reset reads after writes, as the app does when ready."""
+    app_config = DatabaseSupportConfig.create("composed_configuration._database_support")
+    with override_settings(DATABASE_QUERY_SAMPLE_RATE=0.0):
+        app_config.ready()
+    # Django's own receiver would access the real database
+    request_started.disconnect(close_old_connections)
+    yield
+    request_started.connect(close_old_connections)
+    request_started.disconnect(dispatch_uid="composed_configuration._database_support.apps")
+    task_prerun.disconnect(dispatch_uid="composed_configuration._database_support.apps")
+
+
+def test_read_round_robin(make_router):
+    replica_router = make_router(0.0, 0.0)
+
+    reads = [replica_router.db_for_read(None) for _ in range(4)]
+
+    assert reads == ["replica_1", "replica_2", "replica_1", "replica_2"]
+
+
+def test_read_without_replicas(make_router):
+    replica_router = make_router()
+
+    assert replica_router.db_for_read(None) == DEFAULT_DB_ALIAS
+
+
+def test_write(make_router):
+    replica_router = make_router(0.0)
+
+    assert replica_router.db_for_write(None) == DEFAULT_DB_ALIAS
+
+
+def test_read_after_write(make_router):
+    replica_router = make_router(0.0, 0.0)
+
+    replica_router.db_for_write(None)
+
+    # Writes must be visible to subsequent reads
+    assert replica_router.db_for_read(None) == DEFAULT_DB_ALIAS
+    assert replica_router.db_for_read(None) == DEFAULT_DB_ALIAS
+
+
+def test_read_after_write_reset_by_request(make_router, connected_receivers):
+    replica_router = make_router(0.0)
+    replica_router.db_for_write(None)
+
+    request_started.send(sender=None)
+
+    assert replica_router.db_for_read(None) == "replica_1"
+
+
+def test_read_after_write_reset_by_task(make_router, connected_receivers):
+    replica_router = make_router(0.0)
+    replica_router.db_for_write(None)
+
+    task_prerun.send(sender=None, task_id="test-task-id", task=mock.Mock(), args=(), kwargs={})
+
+    assert replica_router.db_for_read(None) == "replica_1"
+
+
+@pytest.mark.parametrize("lag", [60.0, None], ids=["lagging", "unreachable"])
+def test_read_skips_unavailable_replica(make_router, lag):
+    replica_router = make_router(lag, 0.0)
+
+    reads = [replica_router.db_for_read(None) for _ in range(3)]
+
+    assert reads == ["replica_2", "replica_2", "replica_2"]
+
+
+@pytest.mark.parametrize("lag", [60.0, None], ids=["lagging", "unreachable"])
+def test_read_falls_back_to_primary(make_router, lag):
+    replica_router = make_router(lag)
+
+    assert replica_router.db_for_read(None) == DEFAULT_DB_ALIAS
+
+
+def test_replica_availability_cached(make_router):
+    replica_router = make_router(60.0)
+    replica_router.db_for_read(None)
+    # The replica catches up, but isn't checked again until the cached lag expires
+    cursor = router.connections["replica_1"].cursor.return_value.__enter__.return_value
+    cursor.fetchone.return_value = (0.0,)
+
+    assert replica_router.db_for_read(None) == DEFAULT_DB_ALIAS
+
+    with mock.patch.object(router.time, "monotonic", return_value=router.time.monotonic() + 60):
+        assert replica_router.db_for_read(None) == "replica_1"
+    assert cursor.execute.call_count == 2
+
+
+def test_allow_migrate(make_router):
+    replica_router = make_router(0.0)
+
+    assert replica_router.allow_migrate(DEFAULT_DB_ALIAS, "auth") is None
+    assert replica_router.allow_migrate("replica_1", "auth") is False
@@ -0,0 +1,97 @@
+import importlib
+import os
+import sys
+import types
+
+import pytest
+
+from composed_configuration._snapshot import (
+    SNAPSHOT_DIR_ENVIRON_NAME,
+    EnvironRecorder,
+    load_snapshot,
+    snapshot_path,
+    write_snapshot,
+)
+
+
+@pytest.fixture
+def snapshot_dir(tmp_path, monkeypatch):
+    snapshot_dir = tmp_path / "snapshots"
+    monkeypatch.setenv(SNAPSHOT_DIR_ENVIRON_NAME, str(snapshot_dir))
+    return snapshot_dir
+
+
+@pytest.fixture
+def settings_module(tmp_path, monkeypatch):
+    """Return a function which writes and imports a settings module."""
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    def import_settings_module(source: str) -> types.ModuleType:
+        (tmp_path / "snapshot_test_settings.py").write_text(source)
+        sys.modules.pop("snapshot_test_settings", None)
+        importlib.invalidate_caches()
+        return importlib.import_module("snapshot_test_settings")
+
+    yield import_settings_module
+    sys.modules.pop("snapshot_test_settings", None)
+
+
+def test_environ_recorder(monkeypatch):
+    monkeypatch.setenv("SNAPSHOT_TEST_SET", "value")
+    monkeypatch.delenv("SNAPSHOT_TEST_UNSET", raising=False)
+    recorder = EnvironRecorder()
+
+    recorder.start()
+    try:
+        os.environ.get("SNAPSHOT_TEST_SET")
+        assert "SNAPSHOT_TEST_UNSET" not in os.environ
+    finally:
+        recorder.stop()
+    os.environ.get("SNAPSHOT_TEST_AFTER")
+
+    assert recorder.environ == {"SNAPSHOT_TEST_SET": "value", "SNAPSHOT_TEST_UNSET": None}
+
+
+def test_snapshot_stale_environ(snapshot_dir, settings_module, monkeypatch):
+    monkeypatch.setenv("SNAPSHOT_TEST_URL", "first")
+    module = settings_module("class Configuration:\n    pass\n\nSETTING = 1\n")
+    path = snapshot_path(module.Configuration)
+    assert path is not None
+    # This isn't a "DJANGO_" variable, so it's only known to be relevant once it's read
+    recorder = EnvironRecorder()
+    recorder.start()
+    try:
+        os.environ.get("SNAPSHOT_TEST_URL")
+    finally:
+        recorder.stop()
+    write_snapshot(path, module.__name__, recorder.environ)
+
+    assert load_snapshot(path) == {
+        "settings": {"SETTING": 1},
+        "environ": {"SNAPSHOT_TEST_URL": "first"},
+    }
+
+    monkeypatch.setenv("SNAPSHOT_TEST_URL", "second")
+    assert snapshot_path(module.Configuration) == path
+    assert load_snapshot(path) is None
+
+
+def test_snapshot_path_environ(snapshot_dir, settings_module, monkeypatch):
+    module = settings_module("class Configuration:\n    pass\n")
+    path = snapshot_path(module.Configuration)
+
+    monkeypatch.setenv("DJANGO_SNAPSHOT_TEST", "value")
+    assert snapshot_path(module.Configuration) != path
+
+
+def test_snapshot_path_source(snapshot_dir, settings_module):
+    path = snapshot_path(settings_module("class Configuration:\n    pass\n").Configuration)
+
+    changed_module = settings_module("class Configuration:\n    CHANGED = True\n")
+    assert snapshot_path(changed_module.Configuration) != path
+
+
+def test_snapshot_disabled(settings_module, monkeypatch):
+    monkeypatch.delenv(SNAPSHOT_DIR_ENVIRON_NAME, raising=False)
+
+    assert snapshot_path(settings_module("class Configuration:\n    pass\n").Configuration) is None
@@ -0,0 +1,35 @@
+import logging
+from unittest import mock
+
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+from django.test import override_settings
+import pytest
+
+from composed_configuration._django_support import warmup
+from composed_configuration.asgi import get_asgi_application
+from composed_configuration.wsgi import get_wsgi_application
+
+
+@override_settings(ROOT_URLCONF="tests.nonexistent_urls", WARMUP_GC_FREEZE=False)
+def test_warmup_failed_step(caplog):
+    with caplog.at_level(logging.INFO, logger=warmup.__name__):
+        warmup.warmup()
+
+    # A failed step doesn't prevent the later ones
+    (failure,) = [record for record in caplog.records if record.levelno == logging.WARNING]
+    assert failure.getMessage() == "Warmup of URL patterns failed."
+    assert "Warmed up serializers" in caplog.text
+
+
+@pytest.mark.parametrize(
+    ("get_application", "handler_class"),
+    [(get_wsgi_application, WSGIHandler), (get_asgi_application, ASGIHandler)],
+)
+@pytest.mark.parametrize("enabled", [True, False])
+def test_get_application(get_application, handler_class, enabled):
+    with override_settings(WARMUP=enabled), mock.patch.object(warmup, "warmup") as mock_warmup:
+        application = get_application()
+
+    assert isinstance(application, handler_class)
+    assert mock_warmup.called is enabled